@@ -8,12 +8,21 @@ ancestry_strategies.py, crossbreeding_strategies.py) provide the algorithms.
 """
 
 from abc import ABC, abstractmethod
+from operator import itemgetter
 from typing import List, Tuple, Any, Optional, Callable
 from uuid import UUID
 
 from .genome import Genome
 from .alleles import AbstractAllele, CanMutateFilter, CanCrossbreedFilter
 
+# Reads the probability from an ancestry entry; mapped over ancestry, the sum runs in C
+_ancestry_probability = itemgetter(0)
+
+# Node filters used on every crossbreed/mutate call. They hold only their target
+# state, so one instance of each is shared instead of building one per call.
+_CROSSBREED_FILTER = CanCrossbreedFilter(True)
+_MUTATE_FILTER = CanMutateFilter(True)
+
 
 class AbstractStrategy(ABC):
     """
@@ -119,18 +128,71 @@ class AbstractAncestryStrategy(AbstractStrategy):
             ValueError: If fitness not set, my_genome not in population,
                        or ancestry length doesn't match population size
         """
-        # Validation 1: Fitness must be set on all genomes
+        # Validation 1: Fitness must be set on all genomes. The same pass looks for
+        # my_genome by identity (Genome equality is identity; UUIDs are not unique to
+        # one genome, since set_fitness keeps them).
+        my_genome_found = False
         for genome in population:
             if genome.fitness is None:
                 raise ValueError("All genomes must have fitness set before selection")
+            if genome is my_genome:
+                my_genome_found = True
 
         # Validation 2: my_genome must be in population
-        if my_genome not in population:
+        if not my_genome_found:
             raise ValueError("my_genome must be in population")
 
         # Dispatch to concrete hook
         ancestry = self.select_ancestry(my_genome, population)
+        self._validate_ancestry(ancestry, population)
+        return ancestry
+
+    def apply_strategy_many(
+        self,
+        my_genomes: List[Genome],
+        population: List[Genome],
+    ) -> List[List[Tuple[float, UUID]]]:
+        """
+        Select parents for several genomes drawn from the same population.
+
+        Equivalent to calling apply_strategy for each of my_genomes in order, but the
+        population is validated once rather than once per genome, so a generation of
+        M offspring costs one O(N) fitness check instead of M. Work is done in the
+        calling thread: selection hooks are Python code and would serialize on the GIL.
+
+        Args:
+            my_genomes: Genomes being evolved, each of which must be in population
+            population: All genomes in rank order (fitness must be set)
 
+        Returns:
+            One ancestry per entry of my_genomes, in the same order
+
+        Raises:
+            ValueError: If fitness not set, any of my_genomes not in population,
+                       or any ancestry fails the apply_strategy output checks
+        """
+        # Validation 1: Fitness must be set on all genomes, checked once for the batch
+        if any(genome.fitness is None for genome in population):
+            raise ValueError("All genomes must have fitness set before selection")
+
+        # Validation 2: every my_genome must be in population (by identity, as above)
+        member_ids = {id(genome) for genome in population}
+        if not all(id(my_genome) in member_ids for my_genome in my_genomes):
+            raise ValueError("my_genome must be in population")
+
+        ancestries = []
+        for my_genome in my_genomes:
+            ancestry = self.select_ancestry(my_genome, population)
+            self._validate_ancestry(ancestry, population)
+            ancestries.append(ancestry)
+        return ancestries
+
+    @staticmethod
+    def _validate_ancestry(
+        ancestry: List[Tuple[float, UUID]],
+        population: List[Genome],
+    ) -> None:
+        """Check a select_ancestry result against the population it was drawn from."""
         # Validation 3: Ancestry length must match population size
         if len(ancestry) != len(population):
             raise ValueError(
@@ -138,14 +200,12 @@ class AbstractAncestryStrategy(AbstractStrategy):
             )
 
         # Validation 4: Ancestry probabilities must sum to 1.0
-        total = sum(prob for prob, _ in ancestry)
+        total = sum(map(_ancestry_probability, ancestry))
         if abs(total - 1.0) > 1e-9:
             raise ValueError(
                 f"Ancestry probabilities must sum to 1.0, got {total}"
             )
 
-        return ancestry
-
     @abstractmethod
     def select_ancestry(
         self, my_genome: Genome, population: List[Genome]
@@ -209,7 +269,7 @@ class AbstractCrossbreedingStrategy(AbstractStrategy):
         return my_genome.synthesize_new_alleles(
             population,
             self.handle_crossbreeding,
-            predicate=CanCrossbreedFilter(True),
+            predicate=_CROSSBREED_FILTER,
             kwargs={"ancestry": ancestry},
         )
 
@@ -294,7 +354,7 @@ class AbstractMutationStrategy(AbstractStrategy):
         return genome.synthesize_new_alleles(
             population,
             handle_adapter,
-            predicate=CanMutateFilter(True),
+            predicate=_MUTATE_FILTER,
             kwargs={"ancestry": ancestry},
         )
 
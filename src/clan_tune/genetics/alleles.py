@@ -6,8 +6,97 @@ They form trees via metadata, enabling metalearning where mutation parameters
 evolve alongside the values they control.
 """
 
+import heapq
+import weakref
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, List, Callable, Generator, Union
+from typing import Any, Dict, Optional, List, Callable, FrozenSet, Generator, Set, Union
+
+import numpy
+
+# Every concrete allele class, filled in by AbstractAllele.__init_subclass__. Membership
+# of type(v) is a single hash lookup, cheaper than isinstance on the per-value hot paths.
+_ALLELE_TYPES: Set[type] = set()
+
+
+class _NumericDomain(dict):
+    """Normalized {"min", "max"} domain, shared between alleles and never mutated."""
+
+    __slots__ = ("__weakref__",)
+
+
+class _DiscreteDomain(frozenset):
+    """Set of valid values, shared between alleles."""
+
+    __slots__ = ()
+
+
+# Interned domains. Populations repeat a handful of domains across many alleles, and
+# alleles only ever hand out copies of their domain, so equal domains share one
+# object. Entries are weak references, removed once no allele uses the domain; a
+# plain dict of refs is used over WeakValueDictionary because its lookups are
+# several times cheaper, and they happen on every allele construction.
+_DOMAIN_INTERN: Dict[Any, "_DomainRef"] = {}
+
+
+class _DomainRef(weakref.ref):
+    """Weak reference to an interned domain, remembering its intern key."""
+
+    __slots__ = ("key",)
+
+
+def _release_domain(ref: _DomainRef) -> None:
+    """Drop a dead domain's intern entry, unless it was already replaced."""
+    if _DOMAIN_INTERN.get(ref.key) is ref:
+        del _DOMAIN_INTERN[ref.key]
+
+
+def _share_domain(key: Any, domain: Any) -> Any:
+    """Register domain as the interned domain for key and return it."""
+    ref = _DomainRef(domain, _release_domain)
+    ref.key = key
+    _DOMAIN_INTERN[key] = ref
+    return domain
+
+
+def _intern_numeric_domain(domain: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Return the shared normalized domain (both keys present) equal to domain."""
+    if type(domain) is _NumericDomain:
+        return domain
+    low = None if domain is None else domain.get("min")
+    high = None if domain is None else domain.get("max")
+    # Types are part of the key so that e.g. an int bound of 1 is not shared with a
+    # float bound of 1.0, which would change clamped value types.
+    key = (type(low), low, type(high), high)
+    try:
+        ref = _DOMAIN_INTERN.get(key)
+    except TypeError:
+        # Unhashable bound; leave it unshared
+        return {"min": low, "max": high}
+    if ref is not None:
+        shared = ref()
+        if shared is not None:
+            return shared
+    return _share_domain(key, _NumericDomain(min=low, max=high))
+
+
+def _intern_discrete_domain(domain: Any) -> FrozenSet[Any]:
+    """Return the shared frozen set of values equal to domain."""
+    if type(domain) is _DiscreteDomain:
+        return domain
+    frozen = _DiscreteDomain(domain)
+    # Element types are part of the key, as for numeric bounds: {1}, {1.0} and {True}
+    # are equal sets, but sharing one between them would change the values an allele
+    # reports and serializes.
+    key = frozenset((type(value), value) for value in frozen)
+    ref = _DOMAIN_INTERN.get(key)
+    if ref is not None:
+        shared = ref()
+        if shared is not None:
+            return shared
+    return _share_domain(key, frozen)
+
+
+_BOOL_DOMAIN = _DiscreteDomain({True, False})
 
 
 class AbstractAllele(ABC):
@@ -34,6 +123,9 @@ class AbstractAllele(ABC):
        - Type depends on allele: Dict[str, Any] for continuous, Set[Any] for discrete
        - Can be stored in instance variable or computed
        - Called during serialization
+       - Storing it in the _domain slot before calling super().__init__() lets tree
+         utilities compare domains without calling the property; otherwise the
+         property is read once at construction to fill that slot
 
     2. **with_overrides(**constructor_overrides) -> AbstractAllele:**
        - Construct new instance with specified constructor arguments overridden
@@ -60,12 +152,29 @@ class AbstractAllele(ABC):
     - Raise errors for invalid values that cannot be clamped
     """
 
+    # Fixed per-instance layout: alleles are immutable and built in large numbers, so
+    # slots avoid a per-instance __dict__. Subclasses declare empty __slots__ so the
+    # saving is kept; _domain lives here because every allele has one (set by the
+    # subclass, or filled from its domain property in __init__).
+    __slots__ = (
+        "_value",
+        "_can_mutate",
+        "_can_crossbreed",
+        "_metadata",
+        "_domain",
+        "_flattened",
+        "_sorted_metadata_keys",
+        "_subtree_mutate_states",
+        "_subtree_crossbreed_states",
+    )
+
     _registry: Dict[str, type] = {}
 
     def __init_subclass__(cls, **kwargs):
         """Auto-register subclasses for serialization dispatch."""
         super().__init_subclass__(**kwargs)
         AbstractAllele._registry[cls.__name__] = cls
+        _ALLELE_TYPES.add(cls)
 
     def __init__(
         self,
@@ -89,7 +198,29 @@ class AbstractAllele(ABC):
         self._value = value
         self._can_mutate = can_mutate
         self._can_crossbreed = can_crossbreed
-        self._metadata = metadata if metadata is not None else {}
+        # Copied so that later edits to the caller's dict cannot stale the key and
+        # flag caches below.
+        self._metadata = dict(metadata) if metadata is not None else {}
+        # Schema checks compare the _domain slot directly. Built-in alleles set it
+        # before calling this constructor; other subclasses may only implement the
+        # domain property, so it is read once here to fill the slot.
+        try:
+            self._domain
+        except AttributeError:
+            self._domain = self.domain
+        self._flattened: Optional["AbstractAllele"] = None
+        self._sorted_metadata_keys = _sort_metadata_keys(self._metadata)
+
+        # Flag states present anywhere in this subtree. Children are built before
+        # their parent, so this only looks one level down.
+        subtree_mutate = {can_mutate}
+        subtree_crossbreed = {can_crossbreed}
+        for child in self._metadata.values():
+            if type(child) in _ALLELE_TYPES:
+                subtree_mutate |= child._subtree_mutate_states
+                subtree_crossbreed |= child._subtree_crossbreed_states
+        self._subtree_mutate_states = frozenset(subtree_mutate)
+        self._subtree_crossbreed_states = frozenset(subtree_crossbreed)
 
     @property
     def value(self) -> Any:
@@ -127,14 +258,19 @@ class AbstractAllele(ABC):
         """
         Return a new allele with updated value.
 
-        Applies domain validation and clamping through constructor.
+        Applies domain validation and clamping through constructor. If new_value is
+        the current value (same type and equal), this allele is returned instead:
+        alleles are immutable, so an identical rebuild would only cost an allocation.
 
         Args:
             new_value: The new value
 
         Returns:
-            New allele instance with updated value
+            New allele instance with updated value, or self if the value is unchanged
         """
+        current = self._value
+        if type(new_value) is type(current) and new_value == current:
+            return self
         return self.with_overrides(value=new_value)
 
     def with_metadata(self, **updates: Any) -> "AbstractAllele":
@@ -161,8 +297,13 @@ class AbstractAllele(ABC):
         Raw metadata values (int, float, str, etc.) remain unchanged.
         Allele values in metadata are replaced with their .value property.
 
+        Alleles are immutable, so the flattened view is computed once and reused
+        by every later call. Tree walks flatten each node they visit, so repeated
+        walks over the same tree skip the rebuild. An allele with no metadata is
+        already flat and is returned as-is.
+
         Returns:
-            New allele instance with flattened metadata
+            Allele instance with flattened metadata
 
         Example:
             >>> child = FloatAllele(10.0)
@@ -171,13 +312,16 @@ class AbstractAllele(ABC):
             >>> flat.metadata["std"]  # 10.0 (raw value, not allele)
             >>> flat.metadata["rate"]  # 0.1 (unchanged)
         """
-        flattened_metadata = {}
-        for key, val in self._metadata.items():
-            if isinstance(val, AbstractAllele):
-                flattened_metadata[key] = val.value
-            else:
-                flattened_metadata[key] = val
-        return self.with_metadata(**flattened_metadata)
+        if not self._metadata:
+            return self
+        if self._flattened is None:
+            # Bulk copy then patch allele entries in place; raw entries are already correct
+            flattened_metadata = self._metadata.copy()
+            for key, val in self._metadata.items():
+                if type(val) in _ALLELE_TYPES:
+                    flattened_metadata[key] = val.value
+            self._flattened = self.with_overrides(metadata=flattened_metadata)
+        return self._flattened
 
     def unflatten(self, resolved_metadata: Dict[str, "AbstractAllele"]) -> "AbstractAllele":
         """
@@ -206,7 +350,7 @@ class AbstractAllele(ABC):
         """
         merged_metadata = self._metadata.copy()
         merged_metadata.update(resolved_metadata)
-        return self.with_metadata(**merged_metadata)
+        return self.with_overrides(metadata=merged_metadata)
 
     def walk_tree(
         self,
@@ -320,33 +464,46 @@ class AbstractAllele(ABC):
         """
         Convert to dict, including recursive metadata serialization.
 
+        Nested alleles are serialized with an explicit stack rather than recursion,
+        mirroring deserialize(). Raw metadata values are included as they are.
+
         Returns:
             Dict with "type", subclass fields, and recursively serialized metadata
         """
-        # Handle universal metadata recursion
-        serialized_metadata = {}
-        for key, val in self._metadata.items():
-            if isinstance(val, AbstractAllele):
-                serialized_metadata[key] = val.serialize()
+        root: Optional[Dict[str, Any]] = None
+        # Entries are (allele, dict receiving its serialized form, key in that dict)
+        stack: List[tuple] = [(self, None, None)]
+        while stack:
+            allele, target, target_key = stack.pop()
+
+            # Handle universal metadata; nested alleles fill their placeholder later
+            serialized_metadata = {}
+            for key, val in allele._metadata.items():
+                if type(val) in _ALLELE_TYPES:
+                    serialized_metadata[key] = None
+                    stack.append((val, serialized_metadata, key))
+                else:
+                    serialized_metadata[key] = val
+
+            # Combine type field, subclass-specific fields and metadata
+            serialized = {
+                "type": allele.__class__.__name__,
+                **allele.serialize_subclass(),
+                "metadata": serialized_metadata,
+            }
+            if target is None:
+                root = serialized
             else:
-                serialized_metadata[key] = val
-
-        # Get subclass-specific fields
-        subclass_data = self.serialize_subclass()
-
-        # Combine with type field and metadata
-        return {
-            "type": self.__class__.__name__,
-            **subclass_data,
-            "metadata": serialized_metadata,
-        }
+                target[target_key] = serialized
+        return root
 
     @classmethod
     def deserialize(cls, data: Dict[str, Any]) -> "AbstractAllele":
         """
         Reconstruct from dict, dispatching to appropriate subclass.
 
-        Handles type dispatch and recursive metadata deserialization.
+        Handles type dispatch through the subclass registry and metadata
+        deserialization, rebuilding nested alleles before the alleles that hold them.
 
         Args:
             data: Dict with "type" field identifying the subclass
@@ -357,25 +514,49 @@ class AbstractAllele(ABC):
         Raises:
             ValueError: If type field is missing or unknown
         """
-        allele_type = data.get("type")
-        if allele_type is None:
-            raise ValueError("Missing 'type' field in serialized allele data")
-
-        allele_class = cls._registry.get(allele_type)
-        if allele_class is None:
-            raise ValueError(f"Unknown allele type: {allele_type}")
-
-        # Handle universal metadata recursion
-        deserialized_metadata = {}
-        for key, val in data.get("metadata", {}).items():
-            if isinstance(val, dict) and "type" in val:
-                # This is a serialized allele
-                deserialized_metadata[key] = AbstractAllele.deserialize(val)
-            else:
-                deserialized_metadata[key] = val
-
-        # Pass to subclass with metadata already handled
-        return allele_class.deserialize_subclass(data, deserialized_metadata)
+        registry = cls._registry
+        results: List["AbstractAllele"] = []
+        # Entries are (data, None, None) to expand, or (data, allele_class, nested_keys)
+        # to build once the nested alleles under nested_keys are in results. Explicit
+        # stack rather than recursion, so nesting depth is not bounded by the
+        # recursion limit.
+        stack: List[tuple] = [(data, None, None)]
+
+        while stack:
+            node_data, allele_class, nested_keys = stack.pop()
+            metadata = node_data.get("metadata", {})
+
+            if allele_class is None:
+                allele_type = node_data.get("type")
+                if allele_type is None:
+                    raise ValueError("Missing 'type' field in serialized allele data")
+
+                allele_class = registry.get(allele_type)
+                if allele_class is None:
+                    raise ValueError(f"Unknown allele type: {allele_type}")
+
+                # Schedule build, then nested alleles on top (reversed, so they
+                # complete in metadata order)
+                nested_keys = [
+                    key for key, val in metadata.items() if isinstance(val, dict) and "type" in val
+                ]
+                stack.append((node_data, allele_class, nested_keys))
+                for key in reversed(nested_keys):
+                    stack.append((metadata[key], None, None))
+                continue
+
+            # Handle universal metadata: serialized alleles replaced by their rebuilds,
+            # which are the last len(nested_keys) results in metadata order
+            deserialized_metadata = dict(metadata)
+            if nested_keys:
+                start = len(results) - len(nested_keys)
+                deserialized_metadata.update(zip(nested_keys, results[start:]))
+                del results[start:]
+
+            # Pass to subclass with metadata already handled
+            results.append(allele_class.deserialize_subclass(node_data, deserialized_metadata))
+
+        return results[0]
 
     @abstractmethod
     def serialize_subclass(self) -> Dict[str, Any]:
@@ -442,6 +623,8 @@ class FloatAllele(AbstractAllele):
         100.0
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         value: float,
@@ -461,14 +644,8 @@ class FloatAllele(AbstractAllele):
             can_crossbreed: Whether this allele should participate in crossbreeding
             metadata: Optional metadata dict
         """
-        # Normalize domain to always have both keys
-        if domain is None:
-            self._domain = {"min": None, "max": None}
-        else:
-            self._domain = {
-                "min": domain.get("min"),
-                "max": domain.get("max"),
-            }
+        # Normalize domain to always have both keys (shared with equal domains)
+        self._domain = _intern_numeric_domain(domain)
 
         # Clamp value to domain bounds
         clamped_value = value
@@ -482,7 +659,7 @@ class FloatAllele(AbstractAllele):
     @property
     def value(self) -> float:
         """The float value."""
-        return super().value
+        return self._value
 
     @property
     def domain(self) -> Dict[str, Optional[float]]:
@@ -515,10 +692,10 @@ class FloatAllele(AbstractAllele):
             Dict with value, domain, and flags
         """
         return {
-            "value": self.value,
-            "domain": self.domain,
-            "can_mutate": self.can_mutate,
-            "can_crossbreed": self.can_crossbreed,
+            "value": self._value,
+            "domain": self._domain.copy(),
+            "can_mutate": self._can_mutate,
+            "can_crossbreed": self._can_crossbreed,
         }
 
     @classmethod
@@ -570,6 +747,8 @@ class IntAllele(AbstractAllele):
         4
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         value: Union[int, float],
@@ -588,14 +767,8 @@ class IntAllele(AbstractAllele):
             can_crossbreed: Whether this allele should participate in crossbreeding
             metadata: Optional metadata dict
         """
-        # Normalize domain to always have both keys
-        if domain is None:
-            self._domain = {"min": None, "max": None}
-        else:
-            self._domain = {
-                "min": domain.get("min"),
-                "max": domain.get("max"),
-            }
+        # Normalize domain to always have both keys (shared with equal domains)
+        self._domain = _intern_numeric_domain(domain)
 
         # Convert to float internally
         float_value = float(value)
@@ -612,12 +785,12 @@ class IntAllele(AbstractAllele):
     @property
     def value(self) -> int:
         """The rounded integer value."""
-        return round(super().value)
+        return round(self._value)
 
     @property
     def raw_value(self) -> float:
         """The underlying float value."""
-        return super().value
+        return self._value
 
     @property
     def domain(self) -> Dict[str, Optional[int]]:
@@ -632,9 +805,10 @@ class IntAllele(AbstractAllele):
             new_value: The new value (int or float, converted to float internally)
 
         Returns:
-            New IntAllele instance with updated value
+            New IntAllele instance with updated value, or self if the stored value is
+            unchanged
         """
-        return self.with_overrides(value=float(new_value))
+        return super().with_value(float(new_value))
 
     def with_overrides(self, **constructor_overrides: Any) -> "IntAllele":
         """
@@ -662,10 +836,10 @@ class IntAllele(AbstractAllele):
             Dict with value (float), domain, and flags
         """
         return {
-            "value": self.raw_value,
-            "domain": self.domain,
-            "can_mutate": self.can_mutate,
-            "can_crossbreed": self.can_crossbreed,
+            "value": self._value,
+            "domain": self._domain.copy(),
+            "can_mutate": self._can_mutate,
+            "can_crossbreed": self._can_crossbreed,
         }
 
     @classmethod
@@ -709,6 +883,8 @@ class LogFloatAllele(AbstractAllele):
         1e-06
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         value: float,
@@ -730,14 +906,8 @@ class LogFloatAllele(AbstractAllele):
         Raises:
             ValueError: If domain min is missing or <= 0
         """
-        # Normalize domain to always have both keys
-        if domain is None:
-            self._domain = {"min": None, "max": None}
-        else:
-            self._domain = {
-                "min": domain.get("min"),
-                "max": domain.get("max"),
-            }
+        # Normalize domain to always have both keys (shared with equal domains)
+        self._domain = _intern_numeric_domain(domain)
 
         # Validate that min exists and is > 0
         if self._domain["min"] is None:
@@ -757,7 +927,7 @@ class LogFloatAllele(AbstractAllele):
     @property
     def value(self) -> float:
         """The float value."""
-        return super().value
+        return self._value
 
     @property
     def domain(self) -> Dict[str, Optional[float]]:
@@ -790,10 +960,10 @@ class LogFloatAllele(AbstractAllele):
             Dict with value, domain, and flags
         """
         return {
-            "value": self.value,
-            "domain": self.domain,
-            "can_mutate": self.can_mutate,
-            "can_crossbreed": self.can_crossbreed,
+            "value": self._value,
+            "domain": self._domain.copy(),
+            "can_mutate": self._can_mutate,
+            "can_crossbreed": self._can_crossbreed,
         }
 
     @classmethod
@@ -832,6 +1002,8 @@ class BoolAllele(AbstractAllele):
         True
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         value: bool,
@@ -852,23 +1024,23 @@ class BoolAllele(AbstractAllele):
             ValueError: If value is not True or False
         """
         # Domain is always {True, False}
-        self._domain = {True, False}
+        self._domain = _BOOL_DOMAIN
 
         # Validate value is boolean
         if value not in self._domain:
-            raise ValueError(f"Value {value} not in domain {self._domain}")
+            raise ValueError(f"Value {value} not in domain {set(self._domain)}")
 
         super().__init__(value, can_mutate, can_crossbreed, metadata)
 
     @property
     def value(self) -> bool:
         """The boolean value."""
-        return super().value
+        return self._value
 
     @property
     def domain(self) -> set:
         """Return domain constraints (always {True, False})."""
-        return self._domain.copy()
+        return set(self._domain)
 
     def with_overrides(self, **constructor_overrides: Any) -> "BoolAllele":
         """
@@ -895,9 +1067,9 @@ class BoolAllele(AbstractAllele):
             Dict with value and flags
         """
         return {
-            "value": self.value,
-            "can_mutate": self.can_mutate,
-            "can_crossbreed": self.can_crossbreed,
+            "value": self._value,
+            "can_mutate": self._can_mutate,
+            "can_crossbreed": self._can_crossbreed,
         }
 
     @classmethod
@@ -935,6 +1107,8 @@ class StringAllele(AbstractAllele):
         'adam'
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         value: str,
@@ -960,23 +1134,25 @@ class StringAllele(AbstractAllele):
         if domain is None:
             raise ValueError("StringAllele requires domain to be specified")
 
-        self._domain = domain
+        # Frozen and shared with equal domains, so later changes to the caller's set
+        # cannot reach the allele
+        self._domain = _intern_discrete_domain(domain)
 
         # Validate value is in domain
         if value not in self._domain:
-            raise ValueError(f"Value '{value}' not in domain {self._domain}")
+            raise ValueError(f"Value '{value}' not in domain {set(self._domain)}")
 
         super().__init__(value, can_mutate, can_crossbreed, metadata)
 
     @property
     def value(self) -> str:
         """The string value."""
-        return super().value
+        return self._value
 
     @property
     def domain(self) -> set:
         """Return domain constraints (copy for safety)."""
-        return self._domain.copy()
+        return set(self._domain)
 
     def with_overrides(self, **constructor_overrides: Any) -> "StringAllele":
         """
@@ -1004,10 +1180,10 @@ class StringAllele(AbstractAllele):
             Dict with value, domain (as list for JSON compatibility), and flags
         """
         return {
-            "value": self.value,
-            "domain": list(self.domain),
-            "can_mutate": self.can_mutate,
-            "can_crossbreed": self.can_crossbreed,
+            "value": self._value,
+            "domain": list(self._domain),
+            "can_mutate": self._can_mutate,
+            "can_crossbreed": self._can_crossbreed,
         }
 
     @classmethod
@@ -1050,9 +1226,10 @@ def _validate_parallel_types(alleles: List[AbstractAllele]) -> None:
         return
 
     first_type = type(alleles[0])
-    if not all(type(a) == first_type for a in alleles):
-        types = [type(a).__name__ for a in alleles]
-        raise TypeError(f"All alleles must be the same type, got: {types}")
+    for a in alleles:
+        if type(a) is not first_type:
+            types = [type(a).__name__ for a in alleles]
+            raise TypeError(f"All alleles must be the same type, got: {types}")
 
 
 # NOTE: _flatten_metadata() was removed. Use allele.flatten().metadata instead.
@@ -1070,22 +1247,50 @@ def _validate_schemas_match(alleles: List[AbstractAllele]) -> None:
     Raises:
         ValueError: If domains or flags don't match across alleles
     """
-    first_domain = alleles[0].domain
-    if not all(a.domain == first_domain for a in alleles):
+    # Runs at every node of every parallel walk, so the common all-match case is one
+    # loop over slot reads. Equal domains are usually the same interned object, so
+    # identity settles most comparisons without building copies through the domain
+    # property. Any mismatch falls through to the checks below, which pick the error.
+    first = alleles[0]
+    first_domain = first._domain
+    first_mutate = first._can_mutate
+    first_crossbreed = first._can_crossbreed
+    for a in alleles:
+        if (
+            (a._domain is not first_domain and a._domain != first_domain)
+            or a._can_mutate != first_mutate
+            or a._can_crossbreed != first_crossbreed
+        ):
+            break
+    else:
+        return
+
+    if not all(a._domain is first_domain or a._domain == first_domain for a in alleles):
         domains = [a.domain for a in alleles]
         raise ValueError(f"Domain mismatch across sources: {domains}")
 
-    first_mutate = alleles[0].can_mutate
     if not all(a.can_mutate == first_mutate for a in alleles):
         flags = [a.can_mutate for a in alleles]
         raise ValueError(f"can_mutate mismatch across sources: {flags}")
 
-    first_crossbreed = alleles[0].can_crossbreed
     if not all(a.can_crossbreed == first_crossbreed for a in alleles):
         flags = [a.can_crossbreed for a in alleles]
         raise ValueError(f"can_crossbreed mismatch across sources: {flags}")
 
 
+def _sort_metadata_keys(metadata: Dict[Any, Any]) -> tuple:
+    """
+    Return the metadata keys in sorted order, for the per-allele key cache.
+
+    Keys of mixed types that cannot be ordered (e.g. ``1`` and ``"a"``) are kept in
+    insertion order instead, so such metadata is still accepted.
+    """
+    try:
+        return tuple(sorted(metadata))
+    except TypeError:
+        return tuple(metadata)
+
+
 def _collect_metadata_keys(alleles: List[AbstractAllele]) -> List[str]:
     """
     Collect all unique metadata keys across multiple alleles in sorted order.
@@ -1093,13 +1298,36 @@ def _collect_metadata_keys(alleles: List[AbstractAllele]) -> List[str]:
     Args:
         alleles: List of alleles to collect keys from
 
+    Each allele's keys are sorted once at construction. Parallel trees nearly always
+    share one key layout, so that cached tuple is reused directly when every allele
+    matches the first; otherwise this is a streaming merge of the sorted sequences
+    with adjacent duplicates dropped. Keys that cannot be ordered against each
+    other are returned in first-seen order.
+
     Returns:
         Sorted list of unique metadata keys
     """
-    all_keys = set()
+    if not alleles:
+        return []
+    first_keys = alleles[0]._sorted_metadata_keys
     for allele in alleles:
-        all_keys.update(allele.metadata.keys())
-    return sorted(all_keys)
+        if allele._sorted_metadata_keys != first_keys:
+            break
+    else:
+        return list(first_keys)
+
+    merged_keys = []
+    try:
+        for key in heapq.merge(*(allele._sorted_metadata_keys for allele in alleles)):
+            if not merged_keys or merged_keys[-1] != key:
+                merged_keys.append(key)
+    except TypeError:
+        # Keys of mixed, unorderable types: fall back to first-seen order
+        merged = dict.fromkeys(
+            key for allele in alleles for key in allele._sorted_metadata_keys
+        )
+        return list(merged)
+    return merged_keys
 
 
 # Main tree walking utilities
@@ -1120,6 +1348,9 @@ def walk_allele_trees(
     4. Passes list of flattened alleles to handler
     5. If handler returns non-None, yields it
 
+    If the predicate also provides excludes_subtree(node) -> bool (as CanMutateFilter
+    and CanCrossbreedFilter do), subtrees it excludes are skipped without descending.
+
     Args:
         alleles: List of allele trees to walk in parallel
         handler: Function receiving list of flattened alleles, returns Optional[Any]
@@ -1132,37 +1363,178 @@ def walk_allele_trees(
     Raises:
         TypeError: If alleles are not all the same type at any node
     """
-    # Validate type consistency
-    _validate_parallel_types(alleles)
     if predicate is None:
         predicate = lambda node : True
+    yield from _walk_allele_trees_impl(alleles, handler, predicate)
 
-    # Recursively walk all metadata alleles first (children-first)
-    for key in _collect_metadata_keys(alleles):
-        # Peek to check if this key contains alleles or raw values
-        first_value = alleles[0].metadata[key]
-        if not isinstance(first_value, AbstractAllele):
-            continue  # Raw values, no recursion needed
-
-        # Extract alleles from all trees (validation will catch type mismatches)
-        subtrees = [allele.metadata[key] for allele in alleles]
-        yield from walk_allele_trees(
-            subtrees,
-            handler,
-            predicate
-        )
 
-    # Apply filter to current node
-    if not all(predicate(allele) for allele in alleles):
-        return
+def _validate_parallel_subtree_types(nodes: List[AbstractAllele]) -> None:
+    """
+    Apply the walk's type validation to every descendant of the given nodes.
 
-    # Flatten metadata for handler
-    flattened_alleles = [allele.flatten() for allele in alleles]
+    Used when a walk skips a subtree the predicate excludes, so that skipping does not
+    change which inputs raise. Descends exactly where the walk would.
+
+    Raises:
+        TypeError: If alleles are not all the same type at any node
+    """
+    stack = [nodes]
+    while stack:
+        nodes = stack.pop()
+        metadatas = [node._metadata for node in nodes]
+        for key in _collect_metadata_keys(nodes):
+            if type(metadatas[0][key]) in _ALLELE_TYPES:
+                children = [metadata[key] for metadata in metadatas]
+                _validate_parallel_types(children)
+                stack.append(children)
+
+
+def _walk_allele_trees_impl(
+    alleles: List[AbstractAllele],
+    handler: Callable[[List[AbstractAllele]], Optional[Any]],
+    predicate: Callable[[AbstractAllele], bool],
+) -> Generator[Any, None, None]:
+    """
+    Internal implementation of walk_allele_trees.
+
+    Explicit stack rather than recursion, so tree depth is not bounded by the
+    recursion limit and each yielded result leaves directly instead of passing back
+    up through one generator frame per level. Each frame is [nodes, metadatas,
+    keys]: on its first visit it is validated and its metadata keys are listed; each
+    later visit descends into its next allele-valued key; once the keys run out the
+    node itself is processed. Work still happens lazily, as results are consumed.
+    """
+    # Predicates that can rule out a whole subtree let us skip descending into it
+    excludes_subtree = getattr(predicate, "excludes_subtree", None)
+
+    stack: List[list] = [[alleles, None, None]]
+    while stack:
+        frame = stack[-1]
+        nodes, metadatas, keys = frame
+
+        if keys is None:
+            # Validate type consistency
+            _validate_parallel_types(nodes)
+            if excludes_subtree is not None and any(excludes_subtree(a) for a in nodes):
+                # Nothing below is handled, but its types are still checked
+                _validate_parallel_subtree_types(nodes)
+                stack.pop()
+                continue
+
+            # Read metadata dicts directly: the public property returns a defensive
+            # copy, which would otherwise be paid once per key per tree at every node
+            metadatas = frame[1] = [node._metadata for node in nodes]
+            keys = frame[2] = iter(_collect_metadata_keys(nodes))
+
+        # Walk metadata alleles first (children-first): descend into the next key that
+        # holds alleles, skipping raw values (validation will catch type mismatches)
+        for key in keys:
+            if type(metadatas[0][key]) in _ALLELE_TYPES:
+                stack.append([[metadata[key] for metadata in metadatas], None, None])
+                break
+        else:
+            stack.pop()
+
+            # Apply filter to current node
+            if not all(predicate(node) for node in nodes):
+                continue
+
+            # Flatten metadata for handler; call it and yield result if not None
+            result = handler([node.flatten() for node in nodes])
+            if result is not None:
+                yield result
+
+
+def walk_allele_forests(
+    forests: List[List[AbstractAllele]],
+    handler: Callable[[numpy.ndarray], Optional[Any]],
+    predicate: Optional[Callable[[AbstractAllele], bool]] = None,
+    as_array: Optional[Callable[[List[Any]], Any]] = None,
+) -> Generator[Any, None, None]:
+    """
+    Walk a batch of parallel-tree groups in one pass, handing values over as arrays.
+
+    Each forest is one input to walk_allele_trees (a list of parallel trees). All
+    forests are walked together in a single traversal, so the handler is invoked
+    once per node position instead of once per forest per node. At each node the
+    handler receives a numpy array of shape (len(forests), trees_per_forest) where
+    values[f, t] is the value of tree t of forest f at that node, letting it reduce
+    across the whole batch with vectorized operations.
+
+    Traversal order, flattening, and type validation match walk_allele_trees.
+    The predicate must pass for the node in every tree of every forest for the
+    handler to run.
+
+    Args:
+        forests: List of forests; each forest is a list of parallel allele trees.
+            All forests must contain the same number of trees.
+        handler: Function receiving the value array for a node, returns Optional[Any]
+        predicate: Function accepting a node and returning true or false, indicating
+            whether to process it.
+        as_array: Function turning the flat list of values at a node into an array
+            exposing reshape. Defaults to numpy.asarray. Passing another array
+            library's constructor (for example jax.numpy.asarray) lets a handler
+            compiled for that library run on device without a numpy round trip.
+
+    Yields:
+        Non-None values returned by handler
+
+    Raises:
+        ValueError: If forests is empty or forests differ in number of trees
+        TypeError: If alleles are not all the same type at any node
+
+    Example:
+        >>> forests = [[genome_a_lr, genome_b_lr], [genome_c_lr, genome_d_lr]]
+        >>> means = list(walk_allele_forests(forests, lambda values: values.mean(axis=1)))
+    """
+    if not forests:
+        raise ValueError("walk_allele_forests requires at least one forest")
+    trees_per_forest = len(forests[0])
+    if any(len(forest) != trees_per_forest for forest in forests):
+        raise ValueError("All forests must contain the same number of trees")
+
+    if as_array is None:
+        as_array = numpy.asarray
+
+    shape = (len(forests), trees_per_forest)
+
+    def batched_handler(alleles: List[AbstractAllele]) -> Optional[Any]:
+        values = as_array([allele.value for allele in alleles]).reshape(shape)
+        return handler(values)
+
+    all_trees = [tree for forest in forests for tree in forest]
+    yield from walk_allele_trees(all_trees, batched_handler, predicate)
+
+
+_EXPAND = 0
+_REBUILD = 1
 
-    # Call handler and yield result if not None
-    result = handler(flattened_alleles)
-    if result is not None:
-        yield result
+
+def _validate_parallel_subtrees(nodes: List[Union[AbstractAllele, Any]]) -> None:
+    """
+    Validate parallel trees below a node without synthesizing them.
+
+    Applies the same checks as a synthesis pass (matching types and schemas for
+    alleles, equality for raw values) to every descendant of the given nodes, which
+    must already have been validated themselves.
+
+    Raises:
+        TypeError: If alleles are not all the same type at any node
+        ValueError: If raw values don't match or schema mismatch
+    """
+    stack = [nodes]
+    while stack:
+        nodes = stack.pop()
+        metadatas = [a._metadata for a in nodes]
+        for key in _collect_metadata_keys(nodes):
+            children = [metadata[key] for metadata in metadatas]
+            if not type(children[0]) in _ALLELE_TYPES:
+                if not all(v == children[0] for v in children):
+                    raise ValueError(f"Raw value mismatch: {children}")
+                continue
+            _validate_parallel_types(children)
+            _validate_schemas_match(children)
+            stack.append(children)
 
 
 def _synthesize_allele_trees_impl(
@@ -1174,9 +1546,17 @@ def _synthesize_allele_trees_impl(
     """
     Inner helper for synthesize_allele_trees.
 
-    Handles recursion with template index preservation. Accepts both alleles and raw values,
-    using base case check to terminate recursion. Predicate decides whether to apply
-    handler based on template.
+    Traverses the parallel trees with an explicit stack rather than recursion, so
+    tree depth is bounded by memory instead of the interpreter recursion limit.
+    Each node is visited twice: an expand visit validates it and schedules its
+    metadata children, and a rebuild visit (after all children have finished)
+    collects the children's results and applies the handler. Completed results
+    are pushed onto a results stack, so a node's children are always the last
+    len(keys) entries when it is rebuilt. Handler call order is children-first,
+    sorted by metadata key.
+
+    Accepts both alleles and raw values; raw values are validated to match and
+    passed through. Predicate decides whether to apply handler based on template.
 
     Args:
         template_idx: Index of template node in nodes list
@@ -1191,49 +1571,179 @@ def _synthesize_allele_trees_impl(
         TypeError: If nodes are not all the same type
         ValueError: If raw values don't match or schema mismatch
     """
-    # Base case: all raw values (not alleles)
-    if not isinstance(nodes[0], AbstractAllele):
-        # Validate all raw values match exactly
-        if not all(v == nodes[0] for v in nodes):
-            raise ValueError(f"Raw value mismatch: {nodes}")
-        return nodes[0]
-
-    # We're dealing with alleles - cast for type checker
-    alleles: List[AbstractAllele] = nodes  # type: ignore
-
-    # Validate type consistency and schema matching
-    _validate_parallel_types(alleles)
-    _validate_schemas_match(alleles)
-
-    # Recursively synthesize metadata children first (children-first)
-    resolved_metadata = {}
-    for key in _collect_metadata_keys(alleles):
-        # Always recurse - base case handles raw values
-        values = [a.metadata[key] for a in alleles]
-        resolved_metadata[key] = _synthesize_allele_trees_impl(
-            template_idx,
-            values,
-            handler,
-            predicate,
-        )
+    # Predicates that can rule out a whole subtree let us reuse the template subtree
+    # instead of rebuilding it node by node (sources are still validated)
+    excludes_subtree = getattr(predicate, "excludes_subtree", None)
+
+    results: List[Any] = []
+    stack: List[tuple] = [(_EXPAND, nodes, None)]
+
+    while stack:
+        phase, nodes, keys = stack.pop()
+
+        if phase == _EXPAND:
+            # Raw values (not alleles) are leaves: validate they match exactly
+            if not type(nodes[0]) in _ALLELE_TYPES:
+                if not all(v == nodes[0] for v in nodes):
+                    raise ValueError(f"Raw value mismatch: {nodes}")
+                results.append(nodes[0])
+                continue
+
+            # Validate type consistency and schema matching
+            _validate_parallel_types(nodes)
+            _validate_schemas_match(nodes)
+
+            # Every node below would be skipped and rebuilt unchanged from the template
+            if excludes_subtree is not None and excludes_subtree(nodes[template_idx]):
+                _validate_parallel_subtrees(nodes)
+                results.append(nodes[template_idx])
+                continue
+
+            # Schedule rebuild, then children on top so they finish first.
+            # Children are pushed in reverse so they are processed in key order.
+            keys = _collect_metadata_keys(nodes)
+            stack.append((_REBUILD, nodes, keys))
+            metadatas = [a._metadata for a in nodes]
+            for key in reversed(keys):
+                stack.append((_EXPAND, [metadata[key] for metadata in metadatas], None))
+            continue
+
+        # Rebuild: children's results are the last len(keys) entries, in key order
+        alleles: List[AbstractAllele] = nodes
+        if not keys:
+            # No metadata on any node (flat alleles, the common case): every node is
+            # already flat, the template needs no metadata rebuild, and the handler's
+            # result nothing to unflatten
+            template = alleles[template_idx]
+            if not predicate(template):
+                results.append(template)
+                continue
+            results.append(handler(template, list(alleles)))
+            continue
+
+        resolved_metadata = dict(zip(keys, results[-len(keys):]))
+        del results[-len(keys):]
+
+        # Create template: source node at template position with resolved metadata
+        template = alleles[template_idx].with_metadata(**resolved_metadata)
+
+        # Check filtering: if excluded, the template is the result (skip handler)
+        if not predicate(template):
+            results.append(template)
+            continue
+
+        # Flatten template and sources for handler
+        flattened_template = template.flatten()
+        flattened_sources = [a.flatten() for a in alleles]
+
+        # Call handler, then unflatten to restore resolved metadata structure
+        result = handler(flattened_template, flattened_sources)
+        results.append(result.unflatten(resolved_metadata))
+
+    return results[0]
+
+
+def _compile_synthesis_plan(tree: AbstractAllele) -> List[tuple]:
+    """
+    Compile a tree into a flat, post-order list of rebuild instructions.
 
-    # Create template: source node at template position with resolved metadata
-    template_source = alleles[template_idx]
-    template = template_source.with_metadata(**resolved_metadata)
+    Each instruction is (node, allele_keys, child_slots): the node to rebuild, the
+    metadata keys holding child alleles (sorted), and the plan positions where
+    those children's results will be found. A node's position in the plan is its
+    result slot, and children always precede their parent.
 
-    # Check filtering: if excluded, return template (skip handler)
-    if not predicate(template):
-        return template
+    Args:
+        tree: Root of the tree to compile
 
-    # Flatten template and sources for handler
-    flattened_template = template.flatten()
-    flattened_sources = [a.flatten() for a in alleles]
+    Returns:
+        List of instructions, root last
+    """
+    plan: List[tuple] = []
+    # Entries are (node, None) to expand, or (node, child_keys) to emit
+    stack: List[tuple] = [(tree, None)]
+    slot_stack: List[int] = []
+
+    while stack:
+        node, allele_keys = stack.pop()
+        if allele_keys is None:
+            metadata = node._metadata
+            allele_keys = tuple(
+                key for key in node._sorted_metadata_keys if type(metadata[key]) in _ALLELE_TYPES
+            )
+            stack.append((node, allele_keys))
+            for key in reversed(allele_keys):
+                stack.append((metadata[key], None))
+            continue
+
+        # Children were emitted last, in key order, so their slots top the slot stack
+        if allele_keys:
+            child_slots = tuple(slot_stack[-len(allele_keys):])
+            del slot_stack[-len(allele_keys):]
+        else:
+            child_slots = ()
+        slot_stack.append(len(plan))
+        plan.append((node, allele_keys, child_slots))
 
-    # Call handler with (template, sources)
-    result = handler(flattened_template, flattened_sources)
+    return plan
 
-    # Unflatten to restore resolved metadata structure
-    return result.unflatten(resolved_metadata)
+
+def _synthesize_single_tree_impl(
+    tree: AbstractAllele,
+    handler: Callable[[AbstractAllele, List[AbstractAllele]], AbstractAllele],
+    predicate: Callable[[AbstractAllele], bool],
+) -> AbstractAllele:
+    """
+    Specialization of _synthesize_allele_trees_impl for a single source tree.
+
+    With one tree there is nothing to compare against, so the parallel type and
+    schema validation, the metadata key union and the per-level source lists are
+    skipped. The tree is compiled into a post-order rebuild plan and executed as a
+    single straight-line loop. The plan is not cached on the root: it holds the root
+    itself, and synthesis results are new roots that are rarely synthesized twice. Handler
+    calls and results are identical to the general path, except that a subtree
+    the predicate skips entirely is returned as the original objects instead of
+    equal copies.
+
+    Args:
+        tree: The only source tree, which is also the template
+        handler: Function receiving (template, sources) and returning new allele
+        predicate: The predicate handler
+
+    Returns:
+        Synthesized allele
+    """
+    plan = _compile_synthesis_plan(tree)
+
+    results: List[Any] = [None] * len(plan)
+    for slot, (node, allele_keys, child_slots) in enumerate(plan):
+        metadata = node._metadata
+        children = zip(allele_keys, child_slots)
+        if all(results[child_slot] is metadata[key] for key, child_slot in children):
+            # No child changed: the node is its own template, and if the predicate
+            # skips it the original object is reused rather than rebuilt
+            resolved_metadata = metadata
+            template = node
+        else:
+            # Raw entries carry over unchanged; allele entries take their child's result
+            resolved_metadata = metadata.copy()
+            for key, child_slot in zip(allele_keys, child_slots):
+                resolved_metadata[key] = results[child_slot]
+            template = node.with_overrides(metadata=resolved_metadata)
+
+        if not predicate(template):
+            results[slot] = template
+            continue
+
+        flattened = template.flatten()
+        result = handler(flattened, [node.flatten()])
+        if result is flattened and template is node:
+            # Handler kept the value (e.g. with_value of the current value) and no
+            # child changed, so unflattening would rebuild an equal copy of node
+            results[slot] = node
+        else:
+            results[slot] = result.unflatten(resolved_metadata)
+
+    return results[-1]
 
 
 def synthesize_allele_trees(
@@ -1262,6 +1772,10 @@ def synthesize_allele_trees(
     - List order preserved across recursion (important for crossbreeding)
     - Filtering respected (can_mutate/can_crossbreed flags)
 
+    If the predicate also provides excludes_subtree(node) -> bool (as CanMutateFilter
+    and CanCrossbreedFilter do), a template subtree it excludes is returned as-is
+    rather than rebuilt node by node; sources below it are still validated.
+
     See documents/Allele.md lines 89-118 for detailed algorithm specification.
 
     Args:
@@ -1296,6 +1810,10 @@ def synthesize_allele_trees(
     if predicate is None:
         predicate = lambda node : True
 
+    # A lone tree cannot disagree with itself; skip the parallel bookkeeping
+    if len(alleles) == 1:
+        return _synthesize_single_tree_impl(template_tree, handler, predicate)
+
     # Call inner helper with template index
     return _synthesize_allele_trees_impl(
         template_idx, alleles, handler, predicate
@@ -1310,6 +1828,8 @@ class CanMutateFilter:
         pred(node) -> bool
     """
 
+    __slots__ = ("state",)
+
     def __init__(self, state: bool):
         """
         Args:
@@ -1318,7 +1838,12 @@ class CanMutateFilter:
         self.state = state
 
     def __call__(self, node: AbstractAllele) -> bool:
-        return node.can_mutate == self.state
+        # Slot read rather than the property: this runs once per node per genome
+        return node._can_mutate == self.state
+
+    def excludes_subtree(self, node: AbstractAllele) -> bool:
+        """Whether no node in node's tree (node included) can pass this filter."""
+        return self.state not in node._subtree_mutate_states
 
 
 class CanCrossbreedFilter:
@@ -1330,6 +1855,8 @@ class CanCrossbreedFilter:
         pred(node) -> bool
     """
 
+    __slots__ = ("state",)
+
     def __init__(self, state: bool):
         """
         Args:
@@ -1338,4 +1865,9 @@ class CanCrossbreedFilter:
         self.state = state
 
     def __call__(self, node: AbstractAllele) -> bool:
-        return node.can_crossbreed == self.state
+        # Slot read rather than the property: this runs once per node per genome
+        return node._can_crossbreed == self.state
+
+    def excludes_subtree(self, node: AbstractAllele) -> bool:
+        """Whether no node in node's tree (node included) can pass this filter."""
+        return self.state not in node._subtree_crossbreed_states
@@ -50,15 +50,17 @@ class TournamentSelection(AbstractAncestryStrategy):
         my_genome: Genome,
         population: List[Genome],
     ) -> List[Tuple[float, UUID]]:
-        win_counts = {genome.uuid: 0 for genome in population}
+        # Bookkeeping is keyed by uuid.int: hashing a UUID runs Python-level
+        # __hash__ on every lookup, while the int it wraps hashes in C
+        win_counts = {genome.uuid.int: 0 for genome in population}
 
         for _ in range(self.num_tournaments):
             tournament = [self._choose(population) for _ in range(self.tournament_size)]
             winner = min(tournament, key=lambda g: g.fitness)
-            win_counts[winner.uuid] += 1
+            win_counts[winner.uuid.int] += 1
 
         return [
-            (win_counts[genome.uuid] / self.num_tournaments, genome.uuid)
+            (win_counts[genome.uuid.int] / self.num_tournaments, genome.uuid)
             for genome in population
         ]
 
@@ -138,17 +140,17 @@ class RankSelection(AbstractAncestryStrategy):
         population: List[Genome],
     ) -> List[Tuple[float, UUID]]:
         n = len(population)
-        sorted_pop = sorted(population, key=lambda g: g.fitness)
+        # Rank population positions rather than genomes, so weights land in a list
+        # indexed by position instead of a uuid-keyed dict
+        ranked = sorted(range(n), key=lambda i: population[i].fitness)
 
-        weights = {
-            sorted_pop[i].uuid: (n - i) ** self.selection_pressure
-            for i in range(n)
-        }
+        weights = [0.0] * n
+        for rank, index in enumerate(ranked):
+            weights[index] = (n - rank) ** self.selection_pressure
 
-        total = sum(weights.values())
-        probs = {uuid: w / total for uuid, w in weights.items()}
+        total = sum(weights)
 
-        return [(probs[genome.uuid], genome.uuid) for genome in population]
+        return [(w / total, genome.uuid) for w, genome in zip(weights, population)]
 
 
 class BoltzmannSelection(AbstractAncestryStrategy):
@@ -179,15 +181,12 @@ class BoltzmannSelection(AbstractAncestryStrategy):
         my_genome: Genome,
         population: List[Genome],
     ) -> List[Tuple[float, UUID]]:
-        weights = {
-            genome.uuid: math.exp(-genome.fitness / self.temperature)
-            for genome in population
-        }
+        # Weights follow population order, so no uuid-keyed lookup is needed
+        weights = [math.exp(-genome.fitness / self.temperature) for genome in population]
 
-        total = sum(weights.values())
-        probs = {uuid: w / total for uuid, w in weights.items()}
+        total = sum(weights)
 
-        return [(probs[genome.uuid], genome.uuid) for genome in population]
+        return [(w / total, genome.uuid) for w, genome in zip(weights, population)]
 
 
 class TopN(AbstractAncestryStrategy):
@@ -6,12 +6,16 @@ synthesizing offspring allele values from parent alleles based on ancestry proba
 """
 
 import random
+from operator import itemgetter
 from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
 from .abstract_strategies import AbstractCrossbreedingStrategy
 from .alleles import AbstractAllele, FloatAllele
 
+# Probability field of an ancestry entry, read in C when scanning ancestry
+_ancestry_probability = itemgetter(0)
+
 
 class SBXEta(FloatAllele):
     """
@@ -22,6 +26,8 @@ class SBXEta(FloatAllele):
     evolve alongside primary hyperparameters.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         base_eta: float,
@@ -88,7 +94,10 @@ class DominantParent(AbstractCrossbreedingStrategy):
         allele_population: List[AbstractAllele],
         ancestry: List[Tuple[float, UUID]],
     ) -> AbstractAllele:
-        dominant_idx = max(range(len(ancestry)), key=lambda i: ancestry[i][0])
+        # First occurrence of the highest probability: max returns the first maximal
+        # element, and index finds that same object
+        probabilities = list(map(_ancestry_probability, ancestry))
+        dominant_idx = probabilities.index(max(probabilities))
         return template.with_value(allele_population[dominant_idx].value)
 
 
@@ -1,7 +1,29 @@
 """Genome system for ClanTune genetics."""
 
-from uuid import UUID, uuid4
-from typing import Dict, List, Optional, Any, Callable, Generator, Tuple, Literal, Protocol
+import hashlib
+import json
+import os
+import struct
+import sys
+import threading
+from types import MappingProxyType
+from uuid import UUID
+from typing import (
+    Dict,
+    FrozenSet,
+    List,
+    Mapping,
+    Optional,
+    Any,
+    Callable,
+    Generator,
+    Iterable,
+    Tuple,
+    Literal,
+    Protocol,
+)
+
+import numpy
 
 from .alleles import (
     AbstractAllele,
@@ -42,20 +64,135 @@ class UpdateHandler(Protocol):
     def __call__(self, allele: AbstractAllele, **kwargs: Any) -> AbstractAllele: ...
 
 
-# Type registry for string-based dispatch
-_ALLELE_TYPE_REGISTRY: Dict[str, type] = {
+# Type registry for string-based dispatch. Built once at import and read-only, so
+# add_hyperparameter is a single lookup and the table cannot drift at runtime.
+_ALLELE_TYPE_REGISTRY: Mapping[str, type] = MappingProxyType({
     "float": FloatAllele,
     "int": IntAllele,
     "logfloat": LogFloatAllele,
     "bool": BoolAllele,
     "string": StringAllele,
-}
+})
 
 AlleleTypeKey = Literal["float", "int", "logfloat", "bool", "string"]
 
 
+# Random UUID generation. uuid4() reads 16 bytes from os.urandom per call; genomes
+# are created constantly (every add/with_* call), so random bytes are read in
+# blocks per thread and converted to version-4 UUID integers in one batch. A forked
+# child discards the parent's pool so the two processes can never issue the same
+# UUIDs.
+
+_UUID_POOL_BYTES = 4096
+
+# Version 4 / RFC 4122 variant bits, as UUID(bytes=..., version=4) sets them
+_UUID_VERSION_CLEAR = ~((0xF000 << 64) | (0xC000 << 48))
+_UUID_VERSION_4 = (0x4000 << 64) | (0x8000 << 48)
+
+
+class _UUIDPool(threading.local):
+    """Per-thread stack of version-4 UUID integers not yet issued."""
+
+    def __init__(self):
+        self.ints: List[int] = []
+
+
+_uuid_pool = _UUIDPool()
+
+
+def _reset_uuid_pool() -> None:
+    global _uuid_pool
+    _uuid_pool = _UUIDPool()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_uuid_pool)
+
+
+def _new_uuid() -> UUID:
+    """Return a random (version 4) UUID, equivalent to uuid.uuid4()."""
+    ints = _uuid_pool.ints
+    if not ints:
+        block = os.urandom(_UUID_POOL_BYTES)
+        ints.extend(
+            (int.from_bytes(block[start:start + 16], "big") & _UUID_VERSION_CLEAR)
+            | _UUID_VERSION_4
+            for start in range(0, _UUID_POOL_BYTES, 16)
+        )
+    return UUID(int=ints.pop())
+
+
+# JSON codecs, built once. json.dumps constructs a new encoder on every call that
+# passes options, so the configured encoders are shared instead.
+_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"))
+_JSON_DECODER = json.JSONDecoder()
+_CANONICAL_JSON_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"))
+
+# Length prefix for each genome frame in serialize_many (4-byte big-endian unsigned)
+_FRAME_HEADER = struct.Struct(">I")
+
+# Field layout of Genome.parents_array(), as a numpy dtype specification
+_PARENTS_DTYPE = [("probability", "f8"), ("uuid", "V16")]
+
+# Default value of each serialize_bytes() field, by position; trailing defaults are omitted
+_BYTES_FIELD_DEFAULTS = (None, None, None, None, {})
+
+
+def _has_metadata_alleles(genome: "Genome") -> bool:
+    """Whether any allele of the genome holds alleles in its metadata."""
+    return any(
+        isinstance(value, AbstractAllele)
+        for allele in genome._alleles.values()
+        for value in allele.metadata.values()
+    )
+
+
+def _canonical_allele_data(data: Any) -> Any:
+    """
+    Return serialized allele data in an order-independent form for hashing.
+
+    Dict key order is handled by the JSON encoder; discrete domains serialize as lists
+    in set iteration order, so they are sorted here. Only nodes tagged with a registered
+    allele type are treated as alleles; raw metadata dicts are left as they are.
+    """
+    if isinstance(data, dict):
+        canonical = {key: _canonical_allele_data(value) for key, value in data.items()}
+        if (
+            canonical.get("type") in AbstractAllele._registry
+            and isinstance(canonical.get("domain"), list)
+        ):
+            canonical["domain"] = sorted(canonical["domain"], key=repr)
+        return canonical
+    if isinstance(data, list):
+        return [_canonical_allele_data(value) for value in data]
+    return data
+
+
 # Module utilities (public, stateless)
 
+def _validate_same_keys(genomes: List["Genome"]) -> FrozenSet[str]:
+    """
+    Check that all genomes hold the same hyperparameter names, returning them.
+
+    Each genome caches its key set, and derived genomes inherit it, so within a
+    lineage the check is usually an identity comparison rather than a set build and
+    comparison per genome per call. A genome whose equal key set is a different
+    object adopts the first genome's, so repeated checks of the same population
+    (e.g. every generation) settle on identity comparisons.
+
+    Raises:
+        ValueError: If genomes have different hyperparameter keys
+    """
+    first_keys = genomes[0]._hyperparameter_keys()
+    for genome in genomes[1:]:
+        keys = genome._hyperparameter_keys()
+        if keys is not first_keys:
+            if keys != first_keys:
+                raise ValueError("All genomes must have same hyperparameter keys")
+            genome._key_set = first_keys
+    return first_keys
+
+
 def walk_genome_alleles(
     genomes: List["Genome"],
     handler: WalkHandler,
@@ -90,19 +227,24 @@ def walk_genome_alleles(
         return
 
     # Validate all genomes have same hyperparameter keys
-    first_keys = set(genomes[0].alleles.keys())
-    for genome in genomes[1:]:
-        if set(genome.alleles.keys()) != first_keys:
-            raise ValueError("All genomes must have same hyperparameter keys")
+    first_keys = _validate_same_keys(genomes)
 
-    # Walk each hyperparameter in parallel
-    for hyperparam_name in genomes[0].alleles.keys():
-        # Extract alleles for this hyperparameter from all genomes
-        alleles = [genome.alleles[hyperparam_name] for genome in genomes]
-
-        # Create closure adapting handler to unpack kwargs dict
+    # Adapt handler to unpack kwargs dict. Built once: it does not depend on the
+    # hyperparameter, and is called at every node of every tree. Without kwargs the
+    # handler is used as-is.
+    handler_kwargs = kwargs or {}
+    if handler_kwargs:
         def adapted_handler(allele_list: List[AbstractAllele]) -> Optional[Any]:
-            return handler(allele_list, **(kwargs or {}))
+            return handler(allele_list, **handler_kwargs)
+    else:
+        adapted_handler = handler
+
+    # Walk each hyperparameter in parallel. The allele dicts are gathered once, so
+    # each per-hyperparameter gather is a plain subscript rather than a property call.
+    allele_maps = [genome._alleles for genome in genomes]
+    for hyperparam_name in allele_maps[0]:
+        # Extract alleles for this hyperparameter from all genomes
+        alleles = [allele_map[hyperparam_name] for allele_map in allele_maps]
 
         # Delegate to allele utility
         yield from walk_allele_trees(alleles, adapted_handler, predicate)
@@ -114,6 +256,7 @@ def synthesize_genomes(
     handler: SynthesizeHandler,
     predicate: Optional[Callable[[AbstractAllele], bool]] = None,
     kwargs: Optional[Dict[str, Any]] = None,
+    parents: Optional[List[Tuple[float, UUID]]] = None,
 ) -> "Genome":
     """
     Synthesize new genome from population using handler.
@@ -124,7 +267,8 @@ def synthesize_genomes(
     constructs results.
 
     Result has new UUID, no fitness, no ancestry. Strategies should add ancestry
-    separately via with_ancestry().
+    separately via with_ancestry(), or pass it as parents so the result is
+    constructed once with ancestry attached.
 
     Args:
         main_genome: Template genome (must be in population). Used for structure
@@ -137,9 +281,10 @@ def synthesize_genomes(
         predicate: Optional filter. Handler called only if template passes.
             If template fails, template allele used as-is (skip handler).
         kwargs: Optional dict of keyword arguments unpacked into handler at each invocation.
+        parents: Optional ancestry recorded on the result. None leaves it without parents.
 
     Returns:
-        New genome with synthesized alleles (new UUID, no parents, no fitness)
+        New genome with synthesized alleles (new UUID, given parents, no fitness)
 
     Raises:
         ValueError: If main_genome not in population, population empty, or genomes
@@ -149,32 +294,35 @@ def synthesize_genomes(
     # Validate inputs
     if not population:
         raise ValueError("synthesize_genomes requires non-empty population")
-    if main_genome not in population:
+    # Find template position by identity, in the same pass that checks membership
+    template_idx = next((i for i, genome in enumerate(population) if genome is main_genome), None)
+    if template_idx is None:
         raise ValueError("main_genome must be present in population")
 
     # Validate all genomes have same hyperparameter keys
-    first_keys = set(population[0].alleles.keys())
-    for genome in population[1:]:
-        if set(genome.alleles.keys()) != first_keys:
-            raise ValueError("All genomes must have same hyperparameter keys")
+    first_keys = _validate_same_keys(population)
 
-    # Find template position
-    template_idx = population.index(main_genome)
+    # Adapt handler to unpack kwargs dict. Built once, and skipped entirely when
+    # there are no kwargs, since it would only add a call layer at every node.
+    handler_kwargs = kwargs or {}
+    if handler_kwargs:
+        def adapted_handler(
+            template: AbstractAllele,
+            allele_population: List[AbstractAllele],
+        ) -> AbstractAllele:
+            return handler(template, allele_population, **handler_kwargs)
+    else:
+        adapted_handler = handler
 
     # Synthesize alleles for each hyperparameter
+    allele_maps = [genome._alleles for genome in population]
     new_alleles = {}
-    for hyperparam_name in population[0].alleles.keys():
+    unchanged = True
+    for hyperparam_name in allele_maps[0]:
         # Extract alleles for this hyperparameter
-        alleles = [genome.alleles[hyperparam_name] for genome in population]
+        alleles = [allele_map[hyperparam_name] for allele_map in allele_maps]
         template_allele = alleles[template_idx]
 
-        # Create closure adapting handler to unpack kwargs dict
-        def adapted_handler(
-            template: AbstractAllele,
-            allele_population: List[AbstractAllele],
-        ) -> AbstractAllele:
-            return handler(template, allele_population, **(kwargs or {}))
-
         # Delegate to allele utility
         synthesized_allele = synthesize_allele_trees(
             template_allele,
@@ -182,11 +330,68 @@ def synthesize_genomes(
             adapted_handler,
             predicate
         )
-
+        unchanged = unchanged and synthesized_allele is template_allele
         new_alleles[hyperparam_name] = synthesized_allele
 
-    # Return new genome with synthesized alleles (new UUID, no parents, no fitness)
-    return Genome(alleles=new_alleles, parents=None, fitness=None)
+    # Return new genome with synthesized alleles (new UUID, given parents, no fitness).
+    # Keys are unchanged by synthesis, so the offspring shares the key set.
+    if unchanged:
+        # Every allele came back as the template's own object (typically a predicate
+        # that filtered everything): share the template's dict and value caches
+        offspring = Genome(alleles=main_genome._alleles, parents=parents, fitness=None)
+        offspring._hyperparameters = main_genome._hyperparameters
+        offspring._content_hash = main_genome._content_hash
+    else:
+        offspring = Genome(alleles=new_alleles, parents=parents, fitness=None)
+    offspring._key_set = first_keys
+    return offspring
+
+
+def pack_population(
+    genomes: List["Genome"],
+    float_dtype: Optional[Any] = None,
+) -> Dict[str, numpy.ndarray]:
+    """
+    Pack top-level hyperparameter values into one array per hyperparameter.
+
+    Struct-of-arrays view of a population: instead of reaching through each genome
+    and allele object per value, bulk numeric code (statistics, selection math,
+    vectorized reductions) gets a contiguous array per hyperparameter with one
+    entry per genome, in population order. numpy infers the dtype from the values
+    (float64 for floats, int64 for ints, bool, or unicode strings).
+
+    Only top-level allele values are packed; nested metadata alleles are not. Use
+    walk_genome_alleles or walk_allele_forests to reach nested values.
+
+    float_dtype overrides the dtype of float and log-float hyperparameters only, for
+    example numpy.float32 to halve the memory and bandwidth of large reductions.
+    Allele values themselves stay Python floats; only the packed copy is narrowed.
+
+    Args:
+        genomes: Population to pack (in rank order). Must be non-empty.
+        float_dtype: Optional numpy dtype for float-valued hyperparameters. None
+            keeps numpy's inferred float64.
+
+    Returns:
+        Dict mapping each hyperparameter name to an array of shape (len(genomes),)
+
+    Raises:
+        ValueError: If genomes is empty or genomes have different hyperparameter keys
+    """
+    if not genomes:
+        raise ValueError("pack_population requires at least one genome")
+
+    # Validate all genomes have same hyperparameter keys
+    first_keys = _validate_same_keys(genomes)
+
+    allele_maps = [genome._alleles for genome in genomes]
+    packed = {}
+    for name, allele in allele_maps[0].items():
+        dtype = float_dtype if isinstance(allele, (FloatAllele, LogFloatAllele)) else None
+        packed[name] = numpy.array(
+            [alleles[name].value for alleles in allele_maps], dtype=dtype
+        )
+    return packed
 
 
 class Genome:
@@ -202,6 +407,17 @@ class Genome:
     APIs for orchestrators and strategies.
     """
 
+    __slots__ = (
+        "_uuid",
+        "_alleles",
+        "_parents",
+        "_fitness",
+        "_metadata",
+        "_hyperparameters",
+        "_content_hash",
+        "_key_set",
+    )
+
     def __init__(
         self,
         uuid: Optional[UUID] = None,
@@ -221,11 +437,14 @@ class Genome:
             fitness: Evaluation result. None until assigned.
             metadata: Arbitrary genome-level storage for external systems. If None, empty dict.
         """
-        self._uuid = uuid if uuid is not None else uuid4()
+        self._uuid = uuid if uuid is not None else _new_uuid()
         self._alleles = alleles if alleles is not None else {}
         self._parents = parents
         self._fitness = fitness
         self._metadata = metadata if metadata is not None else {}
+        self._hyperparameters: Optional[Dict[str, Any]] = None
+        self._content_hash: Optional[bytes] = None
+        self._key_set: Optional[FrozenSet[str]] = None
 
     # Properties
 
@@ -235,9 +454,15 @@ class Genome:
         return self._uuid
 
     @property
-    def alleles(self) -> Dict[str, AbstractAllele]:
-        """Mapping of hyperparameter names to alleles."""
-        return self._alleles
+    def alleles(self) -> Mapping[str, AbstractAllele]:
+        """
+        Mapping of hyperparameter names to alleles.
+
+        Read-only view: the genome caches state derived from its alleles (key set,
+        as_hyperparameters, content_hash), so changes go through with_alleles() or
+        add_hyperparameter() instead.
+        """
+        return MappingProxyType(self._alleles)
 
     @property
     def parents(self) -> Optional[List[Tuple[float, UUID]]]:
@@ -276,6 +501,10 @@ class Genome:
         This is the only method that can preserve UUID when rebuilding. All other
         methods generate new UUIDs. Use this for general-purpose rebuilding.
 
+        Fields that are not overridden are shared with this genome, not copied.
+        Genomes never modify their containers in place, so sharing is safe and a
+        rebuild costs the same regardless of how many alleles the genome holds.
+
         Args:
             uuid: New UUID, or None to preserve current UUID
             alleles: New alleles dict, or None to preserve current alleles
@@ -286,13 +515,16 @@ class Genome:
         Returns:
             New genome with specified fields replaced
         """
-        return Genome(
+        genome = Genome(
             uuid=uuid if uuid is not None else self._uuid,
             alleles=alleles if alleles is not None else self._alleles,
             parents=parents if parents is not None else self._parents,
             fitness=fitness if fitness is not None else self._fitness,
             metadata=metadata if metadata is not None else self._metadata,
         )
+        if alleles is None:
+            genome._key_set = self._key_set
+        return genome
 
     # Orchestrator methods
 
@@ -326,11 +558,45 @@ class Genome:
         allele_class = _ALLELE_TYPE_REGISTRY[allele_type]
         new_allele = allele_class(value, **allele_kwargs)
 
-        # Build new alleles dict
-        new_alleles = {**self._alleles, name: new_allele}
+        # Build new alleles dict (dict.copy is a single C-level copy). Names are interned
+        # so genomes built separately share key objects and compare keys by identity.
+        new_alleles = self._alleles.copy()
+        new_alleles[sys.intern(name)] = new_allele
+
+        # Preserve parents, fitness and metadata with a new UUID. Every field is known
+        # here, so construct positionally rather than via with_overrides keywords.
+        return Genome(_new_uuid(), new_alleles, self._parents, self._fitness, self._metadata)
+
+    @classmethod
+    def from_hyperparameters(
+        cls,
+        specs: Iterable[Tuple[Any, ...]],
+    ) -> "Genome":
+        """
+        Construct a genome from several hyperparameter specs at once.
 
-        # Use with_overrides to preserve parents and fitness, generate new UUID
-        return self.with_overrides(uuid=uuid4(), alleles=new_alleles)
+        Equivalent to chaining add_hyperparameter on an empty genome, but the alleles
+        dict is built in one pass and a single genome is constructed, rather than one
+        dict copy and one genome per hyperparameter.
+
+        Args:
+            specs: Iterable of (name, value, allele_type) or
+                (name, value, allele_type, allele_kwargs) tuples, in insertion order.
+                allele_kwargs is a dict passed to the allele constructor, as the
+                keyword arguments of add_hyperparameter are.
+
+        Returns:
+            New genome with the given hyperparameters (new UUID, no parents, no fitness)
+
+        Raises:
+            KeyError: If an allele_type is not a recognized type key
+        """
+        alleles = {}
+        for name, value, allele_type, *rest in specs:
+            allele_kwargs = rest[0] if rest else {}
+            allele_class = _ALLELE_TYPE_REGISTRY[allele_type]
+            alleles[sys.intern(name)] = allele_class(value, **allele_kwargs)
+        return cls(alleles=alleles)
 
     def as_hyperparameters(self) -> Dict[str, Any]:
         """
@@ -339,10 +605,35 @@ class Genome:
         Returns allele values (not allele objects) for use by orchestrators
         applying hyperparameters to training systems.
 
+        Genomes are immutable, so the mapping is built on the first call and each
+        call returns a copy of it; callers may modify the result freely.
+
         Returns:
             Dict mapping hyperparameter names to their values
         """
-        return {name: allele.value for name, allele in self._alleles.items()}
+        if self._hyperparameters is None:
+            self._hyperparameters = {name: allele.value for name, allele in self._alleles.items()}
+        return dict(self._hyperparameters)
+
+    def parents_array(self) -> numpy.ndarray:
+        """
+        Ancestry record as a structured array, for vectorized parent selection.
+
+        Struct-of-arrays counterpart of parents: field "probability" (float64) and
+        field "uuid" (the 16 raw UUID bytes, as void so trailing zero bytes are kept)
+        each read as one column, so thresholding or sampling by probability (e.g.
+        numpy.random.choice over arr["uuid"] with p=arr["probability"]) runs in numpy
+        rather than over a list of tuples. UUID(bytes=entry.tobytes()) recovers a
+        UUID. Built on each call; parents itself is unchanged.
+
+        Returns:
+            Array of shape (len(parents),) in rank order; empty if parents is None
+        """
+        parents = self._parents or ()
+        packed = numpy.empty(len(parents), dtype=_PARENTS_DTYPE)
+        packed["probability"] = [probability for probability, _ in parents]
+        packed["uuid"] = [uuid.bytes for _, uuid in parents]
+        return packed
 
     def set_fitness(self, value: float, new_uuid: bool = False) -> "Genome":
         """
@@ -358,10 +649,19 @@ class Genome:
         Returns:
             New genome with fitness assigned
         """
-        if new_uuid:
-            return self.with_overrides(uuid=uuid4(), fitness=value)
-        else:
-            return self.with_overrides(fitness=value)
+        genome = self.with_overrides(
+            uuid=_new_uuid() if new_uuid else None, fitness=value
+        )
+        # Caches that depend only on alleles carry over
+        genome._hyperparameters = self._hyperparameters
+        genome._content_hash = self._content_hash
+        return genome
+
+    def _hyperparameter_keys(self) -> FrozenSet[str]:
+        """Hyperparameter names as a frozenset, built on first use."""
+        if self._key_set is None:
+            self._key_set = frozenset(self._alleles)
+        return self._key_set
 
     def get_fitness(self) -> Optional[float]:
         """
@@ -413,9 +713,7 @@ class Genome:
             UUIDs are converted to strings for JSON compatibility.
         """
         # Serialize alleles dict (recursive via allele.serialize())
-        serialized_alleles = {
-            name: allele.serialize() for name, allele in self._alleles.items()
-        }
+        serialized_alleles = self._serialize_alleles()
 
         # Serialize parents (convert UUIDs to strings)
         serialized_parents = None
@@ -432,6 +730,29 @@ class Genome:
             "metadata": self._metadata,
         }
 
+    def _serialize_alleles(self) -> Dict[str, Any]:
+        """Serialized form of each allele, keyed by hyperparameter name."""
+        return {name: allele.serialize() for name, allele in self._alleles.items()}
+
+    @property
+    def content_hash(self) -> bytes:
+        """
+        16-byte digest of the genome's genetic content.
+
+        Covers hyperparameter names and each allele tree (type, value, domain, flags
+        and metadata), but not uuid, parents, fitness or genome metadata, so genomes
+        carrying the same hyperparameters hash equal. Intended as a key for
+        deduplicating populations or caching fitness. Computed once per genome.
+
+        Raises:
+            TypeError: If allele metadata holds a value that is not JSON serializable
+        """
+        if self._content_hash is None:
+            canonical = _canonical_allele_data(self._serialize_alleles())
+            encoded = _CANONICAL_JSON_ENCODER.encode(canonical)
+            self._content_hash = hashlib.blake2b(encoded.encode(), digest_size=16).digest()
+        return self._content_hash
+
     @classmethod
     def deserialize(cls, data: Dict[str, Any]) -> "Genome":
         """
@@ -446,25 +767,129 @@ class Genome:
         # Deserialize UUID
         uuid = UUID(data["uuid"])
 
-        # Deserialize alleles (recursive via AbstractAllele.deserialize())
+        # Deserialize alleles (recursive via AbstractAllele.deserialize()), interning
+        # names as add_hyperparameter() does
         alleles = {
-            name: AbstractAllele.deserialize(allele_data)
+            sys.intern(name): AbstractAllele.deserialize(allele_data)
             for name, allele_data in data["alleles"].items()
         }
 
-        # Deserialize parents (convert UUID strings back to UUIDs)
+        # Deserialize parents (convert UUID strings back to UUIDs). Optional fields may
+        # be absent, as in hand-written or trimmed payloads, and then take their defaults
         parents = None
-        if data["parents"] is not None:
+        serialized_parents = data.get("parents")
+        if serialized_parents is not None:
             parents = [
                 (probability, UUID(uuid_str))
-                for probability, uuid_str in data["parents"]
+                for probability, uuid_str in serialized_parents
             ]
 
-        fitness = data["fitness"]
-        metadata = data["metadata"]
+        fitness = data.get("fitness")
+        metadata = data.get("metadata")
 
         return cls(uuid=uuid, alleles=alleles, parents=parents, fitness=fitness, metadata=metadata)
 
+    def serialize_bytes(self) -> bytes:
+        """
+        Encode genome as compact UTF-8 JSON, for sending or storing genomes as bytes.
+
+        Fields are written as a positional array, [uuid, alleles, parents, fitness,
+        metadata], with trailing fields omitted while they hold their defaults (no
+        parents, no fitness, empty metadata), and allele entries in their serialize() form.
+        UUIDs, including those in parents, are written as
+        their 128-bit integer value, which decodes without parsing hex text; the
+        payload is therefore meant for Python readers via deserialize_bytes(). Genome
+        and allele metadata must be JSON-compatible (string keys, JSON-encodable values).
+
+        Returns:
+            Encoded genome, readable by deserialize_bytes()
+        """
+        parents = None
+        if self._parents is not None:
+            parents = [(probability, uuid.int) for probability, uuid in self._parents]
+        fields = [self._uuid.int, self._serialize_alleles(), parents, self._fitness, self._metadata]
+        # Drop trailing fields left at their defaults; deserialize_bytes() fills them back in
+        while len(fields) > 2 and fields[-1] == _BYTES_FIELD_DEFAULTS[len(fields) - 1]:
+            fields.pop()
+        return _JSON_ENCODER.encode(fields).encode()
+
+    @classmethod
+    def deserialize_bytes(cls, data: bytes) -> "Genome":
+        """
+        Reconstruct genome from serialize_bytes() output.
+
+        Args:
+            data: Bytes produced by serialize_bytes()
+
+        Returns:
+            Reconstructed Genome instance
+        """
+        fields = _JSON_DECODER.decode(data.decode())
+        # Omitted trailing fields were at their defaults; None restores each of them
+        fields.extend([None] * (len(_BYTES_FIELD_DEFAULTS) - len(fields)))
+        uuid, serialized_alleles, serialized_parents, fitness, metadata = fields
+        alleles = {
+            sys.intern(name): AbstractAllele.deserialize(allele_data)
+            for name, allele_data in serialized_alleles.items()
+        }
+        parents = None
+        if serialized_parents is not None:
+            parents = [
+                (probability, UUID(int=parent)) for probability, parent in serialized_parents
+            ]
+        return cls(UUID(int=uuid), alleles, parents, fitness, metadata)
+
+    @staticmethod
+    def serialize_many(genomes: Iterable["Genome"]) -> bytes:
+        """
+        Encode a population as one buffer of length-prefixed serialize_bytes() frames.
+
+        Each frame is a 4-byte big-endian length followed by that many bytes, so a
+        reader can split the buffer without parsing it; frames are joined once at the
+        end rather than appended to a growing buffer.
+
+        Args:
+            genomes: Genomes to encode, in order
+
+        Returns:
+            Encoded population, readable by deserialize_many()
+        """
+        frames = []
+        for genome in genomes:
+            payload = genome.serialize_bytes()
+            frames.append(_FRAME_HEADER.pack(len(payload)))
+            frames.append(payload)
+        return b"".join(frames)
+
+    @classmethod
+    def deserialize_many(cls, data: bytes) -> List["Genome"]:
+        """
+        Reconstruct a population from serialize_many() output.
+
+        Args:
+            data: Bytes produced by serialize_many()
+
+        Returns:
+            Genomes in their original order
+
+        Raises:
+            ValueError: If data ends partway through a frame
+        """
+        view = memoryview(data)
+        header_size = _FRAME_HEADER.size
+        genomes = []
+        offset = 0
+        while offset < len(view):
+            if offset + header_size > len(view):
+                raise ValueError("Truncated genome frame header")
+            (length,) = _FRAME_HEADER.unpack_from(view, offset)
+            offset += header_size
+            if offset + length > len(view):
+                raise ValueError("Truncated genome frame")
+            genomes.append(cls.deserialize_bytes(view[offset:offset + length].tobytes()))
+            offset += length
+        return genomes
+
     # Strategy support methods
 
     def with_alleles(self, alleles: Dict[str, AbstractAllele]) -> "Genome":
@@ -477,7 +902,7 @@ class Genome:
         Returns:
             New genome with new alleles (new UUID, preserves parents and fitness)
         """
-        return self.with_overrides(uuid=uuid4(), alleles=alleles)
+        return self.with_overrides(uuid=_new_uuid(), alleles=alleles)
 
     def with_ancestry(self, parents: List[Tuple[float, UUID]]) -> "Genome":
         """
@@ -489,7 +914,7 @@ class Genome:
         Returns:
             New genome with new ancestry (new UUID, preserves alleles and fitness)
         """
-        return self.with_overrides(uuid=uuid4(), parents=parents)
+        return self.with_overrides(uuid=_new_uuid(), parents=parents)
 
     def update_alleles(
         self,
@@ -512,17 +937,19 @@ class Genome:
         Returns:
             New genome with transformed alleles (new UUID, no parents, no fitness)
         """
-        # Adapt handler from (allele, **unpacked_kwargs) to (template, sources, **unpacked_kwargs)
+        # Adapt handler from (allele, **unpacked_kwargs) to (template, sources), binding
+        # kwargs here so synthesize_genomes does not wrap the adapter a second time
+        handler_kwargs = kwargs or {}
+
         def adapted_handler(
             template: AbstractAllele,
             sources: List[AbstractAllele],
-            **handler_kwargs
         ) -> AbstractAllele:
             # Single-allele handler - just use template
             return handler(template, **handler_kwargs)
 
         # Delegate to synthesize_genomes with self as both template and only source
-        return synthesize_genomes(self, [self], adapted_handler, predicate, kwargs)
+        return synthesize_genomes(self, [self], adapted_handler, predicate)
 
     def synthesize_new_alleles(
         self,
@@ -550,3 +977,66 @@ class Genome:
         """
         # Ensure self is in population (validation in synthesize_genomes will check)
         return synthesize_genomes(self, population, handler, predicate, kwargs)
+
+    def evolve(
+        self,
+        population: List["Genome"],
+        crossbreed_handler: SynthesizeHandler,
+        mutate_handler: UpdateHandler,
+        ancestry: List[Tuple[float, UUID]],
+        crossbreed_predicate: Optional[Callable[[AbstractAllele], bool]] = None,
+        mutate_predicate: Optional[Callable[[AbstractAllele], bool]] = None,
+    ) -> "Genome":
+        """
+        Crossbreed, mutate and attach ancestry in a single tree pass.
+
+        Fused form of synthesize_new_alleles -> update_alleles -> with_ancestry. At each
+        node the crossbreed handler runs first (if the template passes
+        crossbreed_predicate), then the mutate handler runs on its result (if that
+        passes mutate_predicate), so each tree is rebuilt once instead of twice.
+
+        The result always matches the unfused sequence. Fusing is only done for genomes
+        without metadata alleles: with nested alleles the sequence crossbreeds the whole
+        tree before mutating any of it (a parent's crossbreed handler sees crossbred but
+        unmutated children), so those genomes take two passes, with the ancestry still
+        attached by the second.
+
+        Args:
+            population: List of genomes to synthesize from (should include self)
+            crossbreed_handler: Function receiving (template_allele, source_alleles)
+                and returning new allele
+            mutate_handler: Function receiving the crossbred allele, returns new allele
+            ancestry: Parents list in rank order, recorded on the result
+            crossbreed_predicate: Optional filter. Crossbreed handler called only if
+                the template passes.
+            mutate_predicate: Optional filter. Mutate handler called only if the
+                crossbred allele passes.
+
+        Returns:
+            New genome with evolved alleles (new UUID, parents set to ancestry, no fitness)
+        """
+        def fused_handler(
+            template: AbstractAllele,
+            allele_population: List[AbstractAllele],
+        ) -> AbstractAllele:
+            allele = template
+            if crossbreed_predicate is None or crossbreed_predicate(template):
+                allele = crossbreed_handler(template, allele_population)
+            if mutate_predicate is None or mutate_predicate(allele):
+                allele = mutate_handler(allele)
+            return allele
+
+        if _has_metadata_alleles(self):
+            crossbred = synthesize_genomes(
+                self, population, crossbreed_handler, crossbreed_predicate
+            )
+
+            def mutate_only(template: AbstractAllele, sources: List[AbstractAllele]) -> AbstractAllele:
+                return mutate_handler(template)
+
+            return synthesize_genomes(
+                crossbred, [crossbred], mutate_only, mutate_predicate, parents=ancestry
+            )
+
+        # Ancestry goes straight into synthesis so the offspring is constructed once
+        return synthesize_genomes(self, population, fused_handler, parents=ancestry)
@@ -28,6 +28,8 @@ class GaussianStd(FloatAllele):
     Injected into allele metadata["std"] during setup when use_metalearning=True.
     """
 
+    __slots__ = ()
+
     def __init__(self, base_std: float, *, _domain=None):
         super().__init__(
             base_std,
@@ -52,6 +54,8 @@ class GaussianMutationChance(FloatAllele):
     during setup when use_metalearning=True.
     """
 
+    __slots__ = ()
+
     def __init__(self, value: float):
         super().__init__(value, domain={"min": 0.1, "max": 0.5}, can_mutate=True, can_crossbreed=True)
 
@@ -68,6 +72,8 @@ class CauchyScale(FloatAllele):
     Injected into allele metadata["scale"] during setup when use_metalearning=True.
     """
 
+    __slots__ = ()
+
     def __init__(self, base_scale: float, *, _domain=None):
         super().__init__(
             base_scale,
@@ -92,6 +98,8 @@ class CauchyMutationChance(FloatAllele):
     during setup when use_metalearning=True.
     """
 
+    __slots__ = ()
+
     def __init__(self, value: float):
         super().__init__(value, domain={"min": 0.1, "max": 0.5}, can_mutate=True, can_crossbreed=True)
 
@@ -107,6 +115,8 @@ class DifferentialEvolutionF(FloatAllele):
     when use_metalearning=True.
     """
 
+    __slots__ = ()
+
     def __init__(self, base_F: float):
         super().__init__(
             base_F,
@@ -127,6 +137,8 @@ class UniformMutationChance(FloatAllele):
     during setup when use_metalearning=True.
     """
 
+    __slots__ = ()
+
     def __init__(self, value: float):
         super().__init__(value, domain={"min": 0.01, "max": 0.3}, can_mutate=True, can_crossbreed=True)
 
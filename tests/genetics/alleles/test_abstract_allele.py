@@ -5,6 +5,9 @@ Tests validate public API contracts without coupling to implementation details.
 Tests use minimal concrete implementations to verify AbstractAllele behavior.
 """
 
+import sys
+import threading
+
 import pytest
 from unittest.mock import Mock
 from src.clan_tune.genetics.alleles import AbstractAllele, CanMutateFilter, CanCrossbreedFilter
@@ -104,6 +107,21 @@ class TestAbstractAlleleConstruction:
         # Original metadata unchanged
         assert allele.metadata == {"key": "value"}
 
+    def test_construction_copies_metadata_dict(self):
+        """Later edits to the dict passed in do not reach the allele."""
+        metadata = {"key": "value"}
+        allele = SimpleAllele(42, metadata=metadata)
+        metadata["key"] = SimpleAllele(1, can_mutate=False)
+        assert allele.metadata == {"key": "value"}
+        assert list(allele.walk_tree(lambda node: node.value, CanMutateFilter(False))) == []
+
+    def test_construction_accepts_mixed_type_metadata_keys(self):
+        """Metadata keys that cannot be ordered against each other are accepted and walked."""
+        allele = SimpleAllele(
+            42, metadata={1: SimpleAllele(2), "a": SimpleAllele(3)}
+        )
+        assert sorted(allele.walk_tree(lambda node: node.value)) == [2, 3, 42]
+
 
 class TestAbstractAlleleWithValue:
     """Test suite for with_value method."""
@@ -114,6 +132,12 @@ class TestAbstractAlleleWithValue:
         new_allele = original.with_value(100)
         assert new_allele is not original
 
+    def test_with_value_unchanged_value_returns_self(self):
+        """with_value with the current value reuses the (immutable) allele."""
+        original = SimpleAllele(42, metadata={"k": 1})
+        assert original.with_value(42) is original
+        assert original.with_value(42.0) is not original
+
     def test_with_value_updates_value(self):
         """with_value returns allele with updated value."""
         original = SimpleAllele(42)
@@ -256,6 +280,58 @@ class TestAbstractAlleleSerializationRoundTrip:
         assert level3_restored.value == 3
         assert level3_restored.can_mutate is False
 
+    def test_round_trip_keeps_sibling_nested_alleles_on_their_keys(self):
+        """Several nested alleles mixed with raw values each return under their own key."""
+        original = SimpleAllele(
+            0,
+            metadata={
+                "b": SimpleAllele(2, metadata={"inner": SimpleAllele(20)}),
+                "raw": "keep",
+                "a": SimpleAllele(1),
+            },
+        )
+
+        restored = AbstractAllele.deserialize(original.serialize())
+
+        assert restored.metadata["a"].value == 1
+        assert restored.metadata["b"].value == 2
+        assert restored.metadata["b"].metadata["inner"].value == 20
+        assert restored.metadata["raw"] == "keep"
+
+    def test_deserialize_tree_deeper_than_recursion_limit(self):
+        """Nesting depth is not bounded by the interpreter recursion limit."""
+        depth = sys.getrecursionlimit() + 100
+        data = {"type": "SimpleAllele", "value": 0, "domain": {}, "metadata": {}}
+        for level in range(1, depth):
+            data = {
+                "type": "SimpleAllele",
+                "value": level,
+                "domain": {},
+                "metadata": {"child": data},
+            }
+
+        restored = AbstractAllele.deserialize(data)
+
+        node = restored
+        for level in range(depth - 1, 0, -1):
+            assert node.value == level
+            node = node.metadata["child"]
+        assert node.value == 0
+
+    def test_serialize_tree_deeper_than_recursion_limit(self):
+        """Serializing is not bounded by the interpreter recursion limit either."""
+        depth = sys.getrecursionlimit() + 100
+        allele = SimpleAllele(0)
+        for level in range(1, depth):
+            allele = SimpleAllele(level, metadata={"child": allele})
+
+        data = allele.serialize()
+
+        for level in range(depth - 1, 0, -1):
+            assert data["value"] == level
+            data = data["metadata"]["child"]
+        assert data["value"] == 0
+
     def test_round_trip_reconstructs_correct_subclass_type(self):
         """Serialize then deserialize reconstructs the correct concrete type."""
         original = SimpleAllele(42, domain={"min": 0, "max": 100})
@@ -273,6 +349,38 @@ class TestAbstractAlleleSerializationRoundTrip:
         restored = AbstractAllele.deserialize(serialized)
         assert restored.value == 42
 
+    def test_editing_serialized_dict_does_not_affect_later_serialize(self):
+        """Top-level edits to a serialize() result do not leak into later calls."""
+        allele = SimpleAllele(42, metadata={"nested": SimpleAllele(100)})
+
+        first = allele.serialize()
+        first["type"] = "Other"
+        first["metadata"] = {}
+
+        second = allele.serialize()
+        assert second["type"] == "SimpleAllele"
+        assert AbstractAllele.deserialize(second).metadata["nested"].value == 100
+
+    def test_editing_serialized_data_does_not_affect_later_serialize(self):
+        """Edits to the allele dicts of a serialize() result reach neither the allele nor its parents."""
+        child = SimpleAllele(100)
+        parent = SimpleAllele(42, metadata={"nested": child})
+
+        edited = parent.serialize()
+        edited["metadata"]["nested"]["value"] = 7
+        edited["metadata"]["extra"] = 1
+
+        assert parent.serialize()["metadata"]["nested"]["value"] == 100
+        assert "extra" not in parent.serialize()["metadata"]
+        assert child.serialize()["value"] == 100
+
+    def test_raw_metadata_values_are_passed_through(self):
+        """Raw metadata values are included as they are, even ones that cannot be copied."""
+        lock = threading.Lock()
+        allele = SimpleAllele(42, metadata={"nested": SimpleAllele(1, metadata={"lock": lock})})
+
+        assert allele.serialize()["metadata"]["nested"]["metadata"]["lock"] is lock
+
 
 class TestAbstractAlleleDeserializationErrors:
     """Test suite for deserialization error conditions."""
@@ -493,6 +601,12 @@ class TestFlattenUnflatten:
         assert flat.metadata["rate"] == 0.1
         assert flat.metadata["name"] == "test"
 
+    def test_flatten_without_metadata_returns_self(self):
+        """An allele with no metadata is already flat and is returned as-is."""
+        allele = SimpleAllele(5.0)
+
+        assert allele.flatten() is allele
+
     def test_flatten_handles_mixed_metadata(self):
         """flatten() correctly handles metadata with both alleles and raw values."""
         child = SimpleAllele(10.0)
@@ -526,6 +640,18 @@ class TestFlattenUnflatten:
         assert isinstance(parent.metadata["std"], AbstractAllele)
         assert parent.metadata["std"] is child
 
+    def test_repeated_flatten_is_consistent(self):
+        """Repeated flatten() calls on the same allele give equivalent results."""
+        child = SimpleAllele(10.0)
+        parent = SimpleAllele(5.0, metadata={"std": child, "rate": 0.1})
+
+        first = parent.flatten()
+        second = parent.flatten()
+
+        assert first.value == second.value == 5.0
+        assert first.metadata == second.metadata == {"std": 10.0, "rate": 0.1}
+        assert second is not parent
+
     def test_flatten_preserves_value(self):
         """flatten() preserves the allele's value."""
         child = SimpleAllele(10.0)
@@ -356,6 +356,13 @@ class TestStringAlleleDomainValidation:
         domain_copy.add("new")
         assert "new" not in allele.domain
 
+    def test_domain_unaffected_by_later_changes_to_passed_set(self):
+        """Mutating the set passed as domain does not change the allele's domain."""
+        domain = {"adam", "sgd"}
+        allele = StringAllele("adam", domain=domain)
+        domain.add("new")
+        assert allele.domain == {"adam", "sgd"}
+
 
 class TestStringAlleleValueValidation:
     """Test suite for StringAllele value validation."""
@@ -396,3 +403,73 @@ class TestStringAlleleSerialization:
         serialized = allele.serialize_subclass()
         assert isinstance(serialized["domain"], list)
         assert set(serialized["domain"]) == {"adam", "sgd"}
+
+
+class TestConcreteAlleleLayout:
+    """Test suite for the fixed attribute layout shared by concrete alleles."""
+
+    @pytest.mark.parametrize(
+        "allele",
+        [
+            FloatAllele(1.0),
+            IntAllele(1),
+            LogFloatAllele(0.01, domain={"min": 1e-5, "max": 1.0}),
+            BoolAllele(True),
+            StringAllele("adam", domain={"adam", "sgd"}),
+        ],
+    )
+    def test_rejects_unknown_attributes(self, allele):
+        """Concrete alleles have no per-instance __dict__ for ad hoc attributes."""
+        with pytest.raises(AttributeError):
+            allele.unexpected = 1
+
+
+class TestDomainSharing:
+    """Test suite for sharing of equal domains between alleles."""
+
+    def test_equal_numeric_domains_compare_equal(self):
+        """Alleles built from equal numeric domains report equal domains."""
+        first = FloatAllele(0.1, domain={"min": 0.0, "max": 1.0})
+        second = FloatAllele(0.2, domain={"max": 1.0, "min": 0.0})
+        assert first.domain == second.domain == {"min": 0.0, "max": 1.0}
+        assert first.with_value(0.3).domain == first.domain
+
+    def test_equal_discrete_domains_compare_equal(self):
+        """Alleles built from equal value sets report equal domains."""
+        first = StringAllele("adam", domain={"adam", "sgd"})
+        second = StringAllele("sgd", domain={"sgd", "adam"})
+        assert first.domain == second.domain == {"adam", "sgd"}
+
+    def test_discrete_domain_element_types_kept_apart(self):
+        """Equal sets of differently typed values keep their own element types."""
+        ints = StringAllele(1, domain={1, 2})
+        bools = StringAllele(True, domain={True, 2})
+        floats = StringAllele(1.0, domain={1.0, 2.0})
+
+        assert {type(v) for v in ints.domain} == {int}
+        assert {type(v) for v in bools.domain} == {bool, int}
+        assert {type(v) for v in floats.domain} == {float}
+        assert type(bools.value) is bool
+        assert type(floats.value) is float
+
+    def test_discrete_domain_types_survive_serialization(self):
+        """Serialized domains keep the element types they were built with."""
+        StringAllele(1, domain={1, 2})
+        floats = StringAllele(1.0, domain={1.0, 2.0})
+
+        restored = StringAllele.deserialize(floats.serialize())
+
+        assert {type(v) for v in restored.domain} == {float}
+
+    def test_int_and_float_bounds_kept_apart(self):
+        """An int bound is not shared with an equal float bound, so clamping keeps types."""
+        assert type(FloatAllele(-1.0, domain={"min": 0.0}).value) is float
+        assert type(FloatAllele(-1.0, domain={"min": 0}).value) is int
+
+    def test_shared_domain_is_not_exposed_for_mutation(self):
+        """Domain copies handed out can be edited without affecting other alleles."""
+        first = FloatAllele(0.1, domain={"min": 0.0, "max": 1.0})
+        second = FloatAllele(0.2, domain={"min": 0.0, "max": 1.0})
+        first.domain["max"] = 5.0
+        assert type(first.domain) is dict
+        assert second.domain == {"min": 0.0, "max": 1.0}
@@ -103,6 +103,16 @@ class TestCollectMetadataKeys:
 
         assert keys == ["a"]
 
+    def test_shared_layout_returns_fresh_list(self):
+        """Matching key layouts return a sorted list the caller may modify."""
+        allele1 = FloatAllele(1.0, metadata={"b": 1, "a": 2})
+        allele2 = FloatAllele(2.0, metadata={"a": 3, "b": 4})
+
+        keys = _collect_metadata_keys([allele1, allele2])
+        keys.append("c")
+
+        assert _collect_metadata_keys([allele1, allele2]) == ["a", "b"]
+
 
 class TestValidateSchemasMatch:
     """Test suite for _validate_schemas_match helper function."""
@@ -118,34 +128,22 @@ class TestValidateSchemasMatch:
         # Should not raise
         _validate_schemas_match(alleles)
 
-    def test_raises_on_domain_mismatch(self):
-        """Raises ValueError when domains don't match."""
+    @pytest.mark.parametrize(
+        "first_kwargs,second_kwargs,message",
+        [
+            ({"domain": {"min": 0.0, "max": 10.0}}, {"domain": {"min": 0.0, "max": 20.0}}, "Domain mismatch"),
+            ({"can_mutate": True}, {"can_mutate": False}, "can_mutate mismatch"),
+            ({"can_crossbreed": True}, {"can_crossbreed": False}, "can_crossbreed mismatch"),
+        ],
+    )
+    def test_raises_on_schema_mismatch(self, first_kwargs, second_kwargs, message):
+        """Raises ValueError naming the field whose schema differs."""
         alleles = [
-            FloatAllele(1.0, domain={"min": 0.0, "max": 10.0}),
-            FloatAllele(2.0, domain={"min": 0.0, "max": 20.0}),  # Different max
+            FloatAllele(1.0, **first_kwargs),
+            FloatAllele(2.0, **second_kwargs),
         ]
 
-        with pytest.raises(ValueError, match="Domain mismatch"):
-            _validate_schemas_match(alleles)
-
-    def test_raises_on_can_mutate_mismatch(self):
-        """Raises ValueError when can_mutate flags don't match."""
-        alleles = [
-            FloatAllele(1.0, can_mutate=True),
-            FloatAllele(2.0, can_mutate=False),  # Different flag
-        ]
-
-        with pytest.raises(ValueError, match="can_mutate mismatch"):
-            _validate_schemas_match(alleles)
-
-    def test_raises_on_can_crossbreed_mismatch(self):
-        """Raises ValueError when can_crossbreed flags don't match."""
-        alleles = [
-            FloatAllele(1.0, can_crossbreed=True),
-            FloatAllele(2.0, can_crossbreed=False),  # Different flag
-        ]
-
-        with pytest.raises(ValueError, match="can_crossbreed mismatch"):
+        with pytest.raises(ValueError, match=message):
             _validate_schemas_match(alleles)
 
     def test_error_message_includes_mismatched_values(self):
@@ -163,90 +161,104 @@ class TestValidateSchemasMatch:
         assert "10.0" in error_msg or "10" in error_msg
         assert "20.0" in error_msg or "20" in error_msg
 
+    def test_domain_mismatch_reported_before_flag_mismatch(self):
+        """A domain mismatch is reported even when an earlier allele differs in flags."""
+        alleles = [
+            FloatAllele(1.0, domain={"min": 0.0, "max": 10.0}),
+            FloatAllele(1.0, domain={"min": 0.0, "max": 10.0}, can_mutate=False),
+            FloatAllele(1.0, domain={"min": 0.0, "max": 20.0}),
+        ]
+
+        with pytest.raises(ValueError, match="Domain mismatch"):
+            _validate_schemas_match(alleles)
+
 
 class TestCanMutateFilter:
     """Test suite for CanMutateFilter callable predicate."""
 
-    def test_construction_with_true_state(self):
-        """Filter can be constructed with True state."""
-        pred = CanMutateFilter(True)
-        assert pred.state is True
-
-    def test_construction_with_false_state(self):
-        """Filter can be constructed with False state."""
-        pred = CanMutateFilter(False)
-        assert pred.state is False
+    @pytest.mark.parametrize("state", [True, False])
+    def test_construction_stores_state(self, state):
+        """Filter exposes the state it was constructed with."""
+        pred = CanMutateFilter(state)
+        assert pred.state is state
+
+    @pytest.mark.parametrize(
+        "state,node_flag,expected",
+        [
+            (True, True, True),
+            (True, False, False),
+            (False, False, True),
+            (False, True, False),
+        ],
+    )
+    def test_returns_whether_node_matches_state(self, state, node_flag, expected):
+        """Filter returns True exactly when node can_mutate matches filter state."""
+        pred = CanMutateFilter(state)
+        node = FloatAllele(5.0, can_mutate=node_flag)
+        assert pred(node) is expected
 
-    def test_returns_true_when_node_matches_true_state(self):
-        """Filter returns True when node can_mutate matches filter state (True)."""
+    def test_works_with_intallele(self):
+        """Filter works with different allele types."""
         pred = CanMutateFilter(True)
-        node = FloatAllele(5.0, can_mutate=True)
+        node = IntAllele(42, can_mutate=True)
         assert pred(node) is True
 
-    def test_returns_false_when_node_mismatches_true_state(self):
-        """Filter returns False when node can_mutate doesn't match filter state (True)."""
+    def test_excludes_subtree_when_no_node_matches(self):
+        """excludes_subtree is True when no node in the tree has the filter state."""
         pred = CanMutateFilter(True)
-        node = FloatAllele(5.0, can_mutate=False)
-        assert pred(node) is False
+        child = FloatAllele(1.0, can_mutate=False)
+        node = FloatAllele(5.0, can_mutate=False, metadata={"child": child})
+        assert pred.excludes_subtree(node) is True
 
-    def test_returns_true_when_node_matches_false_state(self):
-        """Filter returns True when node can_mutate matches filter state (False)."""
-        pred = CanMutateFilter(False)
-        node = FloatAllele(5.0, can_mutate=False)
-        assert pred(node) is True
-
-    def test_returns_false_when_node_mismatches_false_state(self):
-        """Filter returns False when node can_mutate doesn't match filter state (False)."""
-        pred = CanMutateFilter(False)
-        node = FloatAllele(5.0, can_mutate=True)
-        assert pred(node) is False
-
-    def test_works_with_intallele(self):
-        """Filter works with different allele types."""
+    def test_does_not_exclude_subtree_when_descendant_matches(self):
+        """excludes_subtree is False when a nested node has the filter state."""
         pred = CanMutateFilter(True)
-        node = IntAllele(42, can_mutate=True)
-        assert pred(node) is True
+        grandchild = FloatAllele(1.0, can_mutate=True)
+        child = FloatAllele(2.0, can_mutate=False, metadata={"child": grandchild})
+        node = FloatAllele(5.0, can_mutate=False, metadata={"child": child})
+        assert pred.excludes_subtree(node) is False
 
 
 class TestCanCrossbreedFilter:
     """Test suite for CanCrossbreedFilter callable predicate."""
 
-    def test_construction_with_true_state(self):
-        """Filter can be constructed with True state."""
-        pred = CanCrossbreedFilter(True)
-        assert pred.state is True
-
-    def test_construction_with_false_state(self):
-        """Filter can be constructed with False state."""
-        pred = CanCrossbreedFilter(False)
-        assert pred.state is False
+    @pytest.mark.parametrize("state", [True, False])
+    def test_construction_stores_state(self, state):
+        """Filter exposes the state it was constructed with."""
+        pred = CanCrossbreedFilter(state)
+        assert pred.state is state
+
+    @pytest.mark.parametrize(
+        "state,node_flag,expected",
+        [
+            (True, True, True),
+            (True, False, False),
+            (False, False, True),
+            (False, True, False),
+        ],
+    )
+    def test_returns_whether_node_matches_state(self, state, node_flag, expected):
+        """Filter returns True exactly when node can_crossbreed matches filter state."""
+        pred = CanCrossbreedFilter(state)
+        node = FloatAllele(5.0, can_crossbreed=node_flag)
+        assert pred(node) is expected
 
-    def test_returns_true_when_node_matches_true_state(self):
-        """Filter returns True when node can_crossbreed matches filter state (True)."""
+    def test_works_with_intallele(self):
+        """Filter works with different allele types."""
         pred = CanCrossbreedFilter(True)
-        node = FloatAllele(5.0, can_crossbreed=True)
+        node = IntAllele(42, can_crossbreed=True)
         assert pred(node) is True
 
-    def test_returns_false_when_node_mismatches_true_state(self):
-        """Filter returns False when node can_crossbreed doesn't match filter state (True)."""
-        pred = CanCrossbreedFilter(True)
-        node = FloatAllele(5.0, can_crossbreed=False)
-        assert pred(node) is False
-
-    def test_returns_true_when_node_matches_false_state(self):
-        """Filter returns True when node can_crossbreed matches filter state (False)."""
+    def test_excludes_subtree_when_no_node_matches(self):
+        """excludes_subtree is True when no node in the tree has the filter state."""
         pred = CanCrossbreedFilter(False)
-        node = FloatAllele(5.0, can_crossbreed=False)
-        assert pred(node) is True
+        child = FloatAllele(1.0, can_crossbreed=True)
+        node = FloatAllele(5.0, can_crossbreed=True, metadata={"child": child})
+        assert pred.excludes_subtree(node) is True
 
-    def test_returns_false_when_node_mismatches_false_state(self):
-        """Filter returns False when node can_crossbreed doesn't match filter state (False)."""
+    def test_does_not_exclude_subtree_when_descendant_matches(self):
+        """excludes_subtree is False when a nested node has the filter state."""
         pred = CanCrossbreedFilter(False)
-        node = FloatAllele(5.0, can_crossbreed=True)
-        assert pred(node) is False
-
-    def test_works_with_intallele(self):
-        """Filter works with different allele types."""
-        pred = CanCrossbreedFilter(True)
-        node = IntAllele(42, can_crossbreed=True)
-        assert pred(node) is True
+        child = FloatAllele(1.0, can_crossbreed=False)
+        node = FloatAllele(5.0, can_crossbreed=True, metadata={"child": child, "rate": 0.1})
+        assert pred.excludes_subtree(node) is False
@@ -5,12 +5,15 @@ Tests validate tree walking and synthesis behavior through observable contracts
 without coupling to implementation details.
 """
 
+import sys
+
 import pytest
 from src.clan_tune.genetics.alleles import (
     AbstractAllele,
     FloatAllele,
     IntAllele,
     walk_allele_trees,
+    walk_allele_forests,
     synthesize_allele_trees,
     CanMutateFilter,
     CanCrossbreedFilter,
@@ -83,6 +86,17 @@ class TestWalkAlleleTreesBasics:
         # Deepest first, then up
         assert values == [3.0, 2.0, 1.0]
 
+    def test_walks_tree_deeper_than_recursion_limit(self):
+        """Tree depth is not bounded by the interpreter recursion limit."""
+        depth = sys.getrecursionlimit() + 100
+        tree = FloatAllele(0.0)
+        for level in range(1, depth):
+            tree = FloatAllele(float(level), metadata={"child": tree})
+
+        values = list(walk_allele_trees([tree, tree], lambda nodes: nodes[1].value))
+
+        assert values == [float(level) for level in range(depth)]
+
 
 class TestWalkAlleleTreesParallelWalking:
     """Test suite for parallel walking of multiple trees."""
@@ -119,6 +133,138 @@ class TestWalkAlleleTreesParallelWalking:
         assert collected == [[10.0, 20.0], [1.0, 2.0]]
 
 
+class TestWalkAlleleTreesFiltering:
+    """Test suite for predicate filtering in walk_allele_trees."""
+
+    def test_filter_visits_matching_nodes_below_excluded_parent(self):
+        """Matching nodes nested under non-matching parents are still visited."""
+        grandchild = FloatAllele(3.0, can_mutate=True)
+        child = FloatAllele(2.0, can_mutate=False, metadata={"child": grandchild})
+        root = FloatAllele(1.0, can_mutate=False, metadata={"child": child})
+
+        def handler(nodes):
+            return nodes[0].value
+
+        results = list(walk_allele_trees([root], handler, CanMutateFilter(True)))
+
+        assert results == [3.0]
+
+    def test_filter_skips_subtrees_without_matching_nodes(self):
+        """Subtrees with no matching node contribute nothing to the walk."""
+        frozen = FloatAllele(2.0, can_mutate=False, metadata={"child": FloatAllele(4.0, can_mutate=False)})
+        live = FloatAllele(3.0, can_mutate=True)
+        root = FloatAllele(1.0, can_mutate=True, metadata={"a": frozen, "b": live})
+
+        def handler(nodes):
+            return nodes[0].value
+
+        results = list(walk_allele_trees([root], handler, CanMutateFilter(True)))
+
+        assert results == [3.0, 1.0]
+
+    def test_filter_still_validates_skipped_subtrees(self):
+        """Type mismatches below a skipped subtree raise, as they do without a filter."""
+        tree1 = FloatAllele(1.0, can_mutate=False, metadata={"child": FloatAllele(2.0, can_mutate=False)})
+        tree2 = FloatAllele(1.0, can_mutate=False, metadata={"child": IntAllele(2, can_mutate=False)})
+
+        with pytest.raises(TypeError):
+            list(walk_allele_trees([tree1, tree2], lambda nodes: None, CanMutateFilter(True)))
+
+
+class TestWalkAlleleForests:
+    """Test suite for batched walking of multiple forests."""
+
+    def test_handler_receives_value_matrix_per_node(self):
+        """Handler receives an array indexed by [forest, tree] at each node."""
+        forests = [
+            [FloatAllele(1.0), FloatAllele(2.0)],
+            [FloatAllele(3.0), FloatAllele(4.0)],
+            [FloatAllele(5.0), FloatAllele(6.0)],
+        ]
+
+        results = list(walk_allele_forests(forests, lambda values: values.tolist()))
+
+        assert results == [[[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]]]
+
+    def test_matches_walking_each_forest_separately(self):
+        """Batched results match per-forest walk_allele_trees results."""
+        def make_tree(base):
+            child = FloatAllele(base * 10, metadata={"rate": 0.1})
+            return FloatAllele(base, metadata={"std": child})
+
+        forests = [[make_tree(1.0), make_tree(2.0)], [make_tree(3.0), make_tree(4.0)]]
+
+        batched = list(walk_allele_forests(forests, lambda values: values.sum(axis=1).tolist()))
+        separate = [
+            list(walk_allele_trees(forest, lambda nodes: sum(n.value for n in nodes)))
+            for forest in forests
+        ]
+
+        # batched[node][forest] == separate[forest][node]
+        assert batched == [list(column) for column in zip(*separate)]
+
+    def test_children_first_order(self):
+        """Nodes are visited children-first, as in walk_allele_trees."""
+        forests = [[FloatAllele(1.0, metadata={"child": FloatAllele(10.0)})]]
+
+        results = list(walk_allele_forests(forests, lambda values: float(values[0, 0])))
+
+        assert results == [10.0, 1.0]
+
+    def test_respects_predicate(self):
+        """Nodes failing the predicate are not passed to the handler."""
+        forests = [
+            [FloatAllele(1.0, can_mutate=False, metadata={"child": FloatAllele(10.0)})],
+            [FloatAllele(2.0, can_mutate=False, metadata={"child": FloatAllele(20.0)})],
+        ]
+
+        results = list(
+            walk_allele_forests(forests, lambda values: values.tolist(), CanMutateFilter(True))
+        )
+
+        assert results == [[[10.0], [20.0]]]
+
+    def test_uses_supplied_array_constructor(self):
+        """Handler receives arrays built by the as_array callable when one is given."""
+        forests = [[FloatAllele(1.0), FloatAllele(2.0)], [FloatAllele(3.0), FloatAllele(4.0)]]
+
+        class RecordingArray:
+            def __init__(self, values):
+                self.values = list(values)
+                self.shape = None
+
+            def reshape(self, shape):
+                self.shape = shape
+                return self
+
+        results = list(
+            walk_allele_forests(forests, lambda values: values, as_array=RecordingArray)
+        )
+
+        assert len(results) == 1
+        assert results[0].values == [1.0, 2.0, 3.0, 4.0]
+        assert results[0].shape == (2, 2)
+
+    def test_raises_on_empty_forests(self):
+        """Raises ValueError when no forests are given."""
+        with pytest.raises(ValueError):
+            list(walk_allele_forests([], lambda values: None))
+
+    def test_raises_on_ragged_forests(self):
+        """Raises ValueError when forests have different numbers of trees."""
+        forests = [[FloatAllele(1.0), FloatAllele(2.0)], [FloatAllele(3.0)]]
+
+        with pytest.raises(ValueError):
+            list(walk_allele_forests(forests, lambda values: None))
+
+    def test_raises_on_type_mismatch_across_forests(self):
+        """Raises TypeError when node types differ between forests."""
+        forests = [[FloatAllele(1.0)], [IntAllele(2)]]
+
+        with pytest.raises(TypeError):
+            list(walk_allele_forests(forests, lambda values: None))
+
+
 class TestSynthesizeAlleleTreesBasics:
     """Test suite for synthesize_allele_trees basic behavior."""
 
@@ -175,6 +321,24 @@ class TestSynthesizeAlleleTreesBasics:
         assert result.metadata["child"].value == 102.0
         assert result.metadata["child"].metadata["child"].value == 103.0
 
+    def test_rebuilds_tree_deeper_than_recursion_limit(self):
+        """Tree depth is not bounded by the interpreter recursion limit."""
+        depth = sys.getrecursionlimit() + 100
+        tree = FloatAllele(0.0)
+        for level in range(1, depth):
+            tree = FloatAllele(float(level), metadata={"child": tree})
+
+        def handler(template, sources):
+            return template.with_value(sources[0].value + 1)
+
+        result = synthesize_allele_trees(tree, [tree], handler)
+
+        node = result
+        for level in range(depth - 1, 0, -1):
+            assert node.value == level + 1
+            node = node.metadata["child"]
+        assert node.value == 1.0
+
 
 class TestSynthesizeAlleleTreesMetadataFlattening:
     """Test suite for metadata flattening in synthesize."""
@@ -237,6 +401,48 @@ class TestSynthesizeAlleleTreesFiltering:
 
         assert result.value == 5.0  # Original value preserved
 
+    def test_excluded_subtree_reuses_template_across_population(self):
+        """A subtree with no matching node is taken from the template unchanged."""
+        frozen1 = FloatAllele(2.0, can_mutate=False, metadata={"c": FloatAllele(4.0, can_mutate=False)})
+        frozen2 = FloatAllele(3.0, can_mutate=False, metadata={"c": FloatAllele(5.0, can_mutate=False)})
+        root1 = FloatAllele(1.0, metadata={"frozen": frozen1})
+        root2 = FloatAllele(7.0, metadata={"frozen": frozen2})
+        calls = []
+
+        def handler(template, sources):
+            calls.append(template.value)
+            return template.with_value(sum(s.value for s in sources))
+
+        result = synthesize_allele_trees(root1, [root1, root2], handler, CanMutateFilter(True))
+
+        assert calls == [1.0]
+        assert result.value == 8.0
+        assert result.metadata["frozen"] is frozen1
+
+    def test_excluded_subtree_still_validates_sources(self):
+        """Schema mismatches below an excluded subtree still raise."""
+        frozen1 = FloatAllele(2.0, can_mutate=False, metadata={"c": FloatAllele(4.0, can_mutate=False)})
+        frozen2 = FloatAllele(3.0, can_mutate=False, metadata={"c": IntAllele(5, can_mutate=False)})
+        root1 = FloatAllele(1.0, metadata={"frozen": frozen1})
+        root2 = FloatAllele(7.0, metadata={"frozen": frozen2})
+
+        def handler(template, sources):
+            return template
+
+        with pytest.raises(TypeError):
+            synthesize_allele_trees(root1, [root1, root2], handler, CanMutateFilter(True))
+
+    def test_unchanged_flat_template_is_reused(self):
+        """Flat template alleles that are skipped or returned unchanged are not rebuilt."""
+        template = FloatAllele(1.0)
+        other = FloatAllele(2.0)
+
+        skipped = synthesize_allele_trees(template, [template, other], lambda t, s: t, lambda n: False)
+        kept = synthesize_allele_trees(template, [template, other], lambda t, s: t)
+
+        assert skipped is template
+        assert kept is template
+
 
 class TestSynthesizeAlleleTreesParallelSynthesis:
     """Test suite for parallel synthesis from multiple trees."""
@@ -267,6 +473,85 @@ class TestSynthesizeAlleleTreesParallelSynthesis:
 
         assert isinstance(result, IntAllele)
 
+    def test_single_tree_matches_parallel_synthesis_of_same_tree(self):
+        """Synthesizing one tree behaves like synthesizing it alongside a copy of itself."""
+        tree = FloatAllele(
+            1.0,
+            metadata={
+                "std": FloatAllele(0.5, metadata={"rate": 0.1}),
+                "label": "lr",
+                "steps": IntAllele(3, can_mutate=False),
+            },
+        )
+        calls = {1: [], 2: []}
+
+        def make_handler(n_sources):
+            def handler(template, sources):
+                calls[n_sources].append((template.value, template.metadata))
+                return template.with_value(template.value * 2)
+            return handler
+
+        predicate = CanMutateFilter(True)
+        single = synthesize_allele_trees(tree, [tree], make_handler(1), predicate)
+        parallel = synthesize_allele_trees(tree, [tree, tree], make_handler(2), predicate)
+
+        assert calls[1] == calls[2]
+        assert single.serialize() == parallel.serialize()
+
+
+    def test_repeated_single_tree_synthesis_is_consistent(self):
+        """Synthesizing the same tree again calls the handler identically each time."""
+        tree = FloatAllele(1.0, metadata={"std": FloatAllele(0.5), "label": "lr"})
+        seen = []
+
+        def handler(template, sources):
+            seen.append(template.value)
+            return template.with_value(template.value + sources[0].value)
+
+        first = synthesize_allele_trees(tree, [tree], handler)
+        second = synthesize_allele_trees(tree, [tree], handler)
+
+        assert seen == [0.5, 1.0, 0.5, 1.0]
+        assert first.serialize() == second.serialize()
+        assert first.metadata["std"].value == 1.0
+        assert first.metadata["label"] == "lr"
+
+    def test_subclass_with_domain_property_only(self):
+        """A user allele implementing domain only as a property synthesizes and validates."""
+
+        class RangeAllele(AbstractAllele):
+            def __init__(self, value, bound=1.0, metadata=None):
+                self.bound = bound
+                super().__init__(value, metadata=metadata)
+
+            @property
+            def domain(self):
+                return {"min": 0.0, "max": self.bound}
+
+            def with_overrides(self, **overrides):
+                return RangeAllele(
+                    overrides.get("value", self.value),
+                    self.bound,
+                    overrides.get("metadata", self.metadata),
+                )
+
+            def serialize_subclass(self):
+                return {"value": self.value, "bound": self.bound}
+
+            @classmethod
+            def deserialize_subclass(cls, data, metadata):
+                return cls(data["value"], data["bound"], metadata)
+
+        def handler(template, sources):
+            return template.with_value(sum(s.value for s in sources))
+
+        first = RangeAllele(0.25)
+        result = synthesize_allele_trees(first, [first, RangeAllele(0.5)], handler)
+        assert result.value == 0.75
+
+        with pytest.raises(ValueError, match="Domain mismatch"):
+            synthesize_allele_trees(first, [first, RangeAllele(0.5, bound=2.0)], handler)
+
 
 class TestSynthesizeAlleleTreesImmutability:
     """Test suite for immutability contracts."""
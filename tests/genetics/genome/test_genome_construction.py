@@ -23,6 +23,13 @@ class TestGenomeConstruction:
         assert genome.parents is None
         assert genome.fitness is None
 
+    def test_generated_uuids_are_random_and_unique(self):
+        """Generated UUIDs are version 4 and never repeat across many genomes."""
+        uuids = [Genome().uuid for _ in range(1000)]
+
+        assert all(u.version == 4 for u in uuids)
+        assert len(set(uuids)) == len(uuids)
+
     def test_construction_with_explicit_uuid(self):
         """Genome constructed with explicit UUID preserves that UUID."""
         explicit_uuid = UUID("12345678-1234-5678-1234-567812345678")
@@ -104,6 +111,24 @@ class TestWithOverrides:
         assert rebuilt.parents == parents
         assert rebuilt.fitness == 0.9
 
+    def test_with_overrides_shares_unchanged_fields(self):
+        """Fields not being overridden are shared with the original, not copied."""
+        genome = Genome(alleles={"lr": FloatAllele(0.01)}, metadata={"run": 1})
+
+        rebuilt = genome.with_overrides(fitness=0.9)
+
+        assert rebuilt.alleles["lr"] is genome.alleles["lr"]
+        assert rebuilt.metadata is genome.metadata
+
+    def test_alleles_cannot_be_edited_in_place(self):
+        """The alleles mapping is read-only, so cached derived state cannot go stale."""
+        genome = Genome(alleles={"lr": FloatAllele(0.1)})
+        genome.as_hyperparameters()
+
+        with pytest.raises(TypeError):
+            genome.alleles["wd"] = FloatAllele(0.5)
+        assert genome.as_hyperparameters() == {"lr": 0.1}
+
     def test_with_overrides_is_immutable(self):
         """with_overrides returns new genome, leaves original unchanged."""
         genome = Genome(fitness=0.5)
@@ -225,6 +250,35 @@ class TestAddHyperparameter:
             genome.add_hyperparameter("lr", 0.01, "invalid_type")
 
 
+class TestFromHyperparameters:
+    """Test Genome.from_hyperparameters bulk constructor."""
+
+    def test_matches_add_hyperparameter_chain(self):
+        """Bulk construction gives the same hyperparameters, in order, as chaining."""
+        chained = (
+            Genome()
+            .add_hyperparameter("lr", 0.01, "float", domain={"min": 0.0, "max": 1.0})
+            .add_hyperparameter("layers", 3, "int")
+            .add_hyperparameter("act", "relu", "string", domain={"relu", "gelu"})
+        )
+
+        bulk = Genome.from_hyperparameters([
+            ("lr", 0.01, "float", {"domain": {"min": 0.0, "max": 1.0}}),
+            ("layers", 3, "int"),
+            ("act", "relu", "string", {"domain": {"relu", "gelu"}}),
+        ])
+
+        assert list(bulk.alleles) == list(chained.alleles)
+        assert bulk.serialize()["alleles"] == chained.serialize()["alleles"]
+        assert bulk.parents is None
+        assert bulk.fitness is None
+
+    def test_invalid_type_raises_error(self):
+        """Unknown allele type keys raise KeyError."""
+        with pytest.raises(KeyError):
+            Genome.from_hyperparameters([("lr", 0.01, "complex")])
+
+
 class TestAsHyperparameters:
     """Test as_hyperparameters extraction method."""
 
@@ -264,6 +318,17 @@ class TestAsHyperparameters:
             "optimizer": "adam"
         }
 
+    def test_as_hyperparameters_result_is_independent_copy(self):
+        """Mutating a returned mapping does not affect later calls."""
+        genome = Genome().add_hyperparameter("lr", 0.01, "float")
+
+        first = genome.as_hyperparameters()
+        first["lr"] = 1.0
+        first["extra"] = 2
+
+        assert genome.as_hyperparameters() == {"lr": 0.01}
+        assert genome.as_hyperparameters() is not genome.as_hyperparameters()
+
 
 class TestSetAndGetFitness:
     """Test set_fitness and get_fitness methods."""
@@ -320,6 +385,39 @@ class TestSetAndGetFitness:
         assert genome.get_fitness() is None  # Original unchanged
         assert new_genome.get_fitness() == 0.85
 
+    def test_set_fitness_after_serialize_reserializes(self):
+        """Serialized form of the result reflects the new fitness and UUID."""
+        genome = Genome().add_hyperparameter("lr", 0.01, "float")
+        genome.serialize()
+        genome.as_hyperparameters()
+
+        rescored = genome.set_fitness(0.5, new_uuid=True)
+
+        assert rescored.serialize()["fitness"] == 0.5
+        assert rescored.serialize()["uuid"] == str(rescored.uuid)
+        assert rescored.as_hyperparameters() == {"lr": 0.01}
+        assert genome.serialize()["fitness"] is None
+
+    def test_set_fitness_rebuilds_through_with_overrides(self):
+        """A subclass that overrides with_overrides keeps its type through set_fitness."""
+
+        class TaggedGenome(Genome):
+            __slots__ = ()
+
+            def with_overrides(self, **overrides):
+                rebuilt = super().with_overrides(**overrides)
+                return TaggedGenome(
+                    rebuilt.uuid, rebuilt.alleles, rebuilt.parents, rebuilt.fitness, rebuilt.metadata
+                )
+
+        genome = TaggedGenome(alleles={"lr": FloatAllele(0.01)})
+
+        rescored = genome.set_fitness(0.5)
+
+        assert isinstance(rescored, TaggedGenome)
+        assert rescored.get_fitness() == 0.5
+        assert rescored.content_hash == genome.content_hash
+
 
 class TestMetadata:
     """Test genome-level metadata storage."""
@@ -396,3 +494,10 @@ class TestImmutability:
 
         assert genome1.alleles == {}
         assert "lr" in genome2.alleles
+
+    def test_genome_rejects_unknown_attributes(self):
+        """Genome has no per-instance __dict__ for ad hoc attributes."""
+        genome = Genome()
+
+        with pytest.raises(AttributeError):
+            genome.unexpected = 1
@@ -5,6 +5,8 @@ Tests round-trip preservation of UUID, alleles, parents, fitness, and nested all
 All tests use black-box methodology - no inspection of serialization schema.
 """
 
+import threading
+
 import pytest
 from uuid import UUID
 from src.clan_tune.genetics.genome import Genome
@@ -164,6 +166,46 @@ class TestGenomeSerialization:
 
         assert isinstance(data, dict)
 
+    def test_repeated_serialize_is_consistent(self):
+        """Serializing the same genome again gives an equal dict."""
+        genome = Genome(fitness=0.5).add_hyperparameter("lr", 0.01, "float")
+
+        assert genome.serialize() == genome.serialize()
+
+    def test_editing_serialized_dict_does_not_affect_later_serialize(self):
+        """Replacing a top-level field in one result does not leak into the next."""
+        genome = Genome(fitness=0.5)
+
+        data = genome.serialize()
+        data["fitness"] = 0.9
+
+        assert genome.serialize()["fitness"] == 0.5
+
+    def test_editing_nested_serialized_data_does_not_affect_later_output(self):
+        """Edits inside the alleles or parents of one result do not leak anywhere."""
+        parent_uuid = UUID("11111111-1111-1111-1111-111111111111")
+        genome = Genome(parents=[(1.0, parent_uuid)])
+        genome = genome.add_hyperparameter("lr", 0.01, "float")
+        expected_bytes = genome.serialize_bytes()
+        expected_hash = genome.content_hash
+
+        data = genome.serialize()
+        data["alleles"]["lr"]["value"] = 0.5
+        data["parents"].append((0.0, "x"))
+
+        again = genome.serialize()
+        assert again["alleles"]["lr"]["value"] == 0.01
+        assert len(again["parents"]) == 1
+        assert genome.serialize_bytes() == expected_bytes
+        assert Genome.deserialize(genome.serialize()).content_hash == expected_hash
+
+    def test_metadata_values_are_passed_through(self):
+        """Genome metadata may hold arbitrary objects, which serialize() includes as is."""
+        lock = threading.Lock()
+        genome = Genome(metadata={"lock": lock})
+
+        assert genome.serialize()["metadata"]["lock"] is lock
+
     def test_none_fitness_round_trip(self):
         """Genome with explicitly None fitness survives round-trip."""
         genome = Genome(fitness=None)
@@ -173,6 +215,30 @@ class TestGenomeSerialization:
 
         assert restored.fitness is None
 
+    def test_deserialize_treats_missing_optional_fields_as_defaults(self):
+        """Absent parents, fitness and metadata load as their defaults."""
+        data = Genome().add_hyperparameter("lr", 0.01, "float").serialize()
+        for key in ("parents", "fitness", "metadata"):
+            del data[key]
+
+        restored = Genome.deserialize(data)
+
+        assert restored.parents is None
+        assert restored.fitness is None
+        assert restored.metadata == {}
+
+    def test_decoded_genomes_share_hyperparameter_names(self):
+        """Names decoded from separate payloads are the same string object."""
+        name = "".join(["optimizer/0/", "lr"])
+        genome = Genome().add_hyperparameter(name, 0.01, "float")
+
+        from_dict = Genome.deserialize(genome.serialize())
+        from_bytes = Genome.deserialize_bytes(genome.serialize_bytes())
+
+        key = next(iter(genome.alleles))
+        assert next(iter(from_dict.alleles)) is key
+        assert next(iter(from_bytes.alleles)) is key
+
     def test_zero_probability_parents_round_trip(self):
         """Parents with 0.0 probability survive round-trip."""
         parent_uuid1 = UUID("11111111-1111-1111-1111-111111111111")
@@ -296,3 +362,145 @@ class TestSerializationContract:
         assert isinstance(restored.alleles["lr"], FloatAllele)
         assert isinstance(restored.alleles["bs"], IntAllele)
         assert isinstance(restored.alleles["use_nesterov"], BoolAllele)
+
+
+class TestByteSerialization:
+    """Test serialize_bytes/deserialize_bytes round-trip preservation."""
+
+    def test_serialize_bytes_returns_bytes(self):
+        """serialize_bytes produces bytes."""
+        genome = Genome().add_hyperparameter("lr", 0.01, "float")
+
+        assert isinstance(genome.serialize_bytes(), bytes)
+
+    def test_bytes_round_trip_preserves_genome(self):
+        """Byte round-trip preserves UUID, nested alleles, parents, fitness and metadata."""
+        parent = UUID("11111111-1111-1111-1111-111111111111")
+        genome = Genome(
+            alleles={
+                "lr": FloatAllele(0.01, metadata={"std": FloatAllele(0.1, can_mutate=False)}),
+                "opt": StringAllele("adam", domain={"adam", "sgd"}),
+            },
+            parents=[(1.0, parent)],
+            fitness=0.75,
+            metadata={"step": 3},
+        )
+
+        restored = Genome.deserialize_bytes(genome.serialize_bytes())
+
+        assert restored.uuid == genome.uuid
+        assert restored.as_hyperparameters() == genome.as_hyperparameters()
+        assert restored.alleles["lr"].metadata["std"].can_mutate is False
+        assert restored.alleles["opt"].domain == {"adam", "sgd"}
+        assert restored.parents == [(1.0, parent)]
+        assert restored.fitness == 0.75
+        assert restored.metadata == {"step": 3}
+
+    def test_default_fields_omitted_and_restored(self):
+        """Trailing default fields are left out of the payload and restored on load."""
+        genome = Genome().add_hyperparameter("lr", 0.01, "float")
+        rescored = genome.set_fitness(0.5)
+
+        restored = Genome.deserialize_bytes(genome.serialize_bytes())
+
+        assert len(genome.serialize_bytes()) < len(rescored.serialize_bytes())
+        assert restored.parents is None
+        assert restored.fitness is None
+        assert restored.metadata == {}
+        assert restored.metadata is not Genome.deserialize_bytes(genome.serialize_bytes()).metadata
+
+    def test_falsy_fitness_round_trips(self):
+        """A fitness of 0.0 is not mistaken for an omitted field."""
+        genome = Genome().add_hyperparameter("lr", 0.01, "float").set_fitness(0.0)
+
+        assert Genome.deserialize_bytes(genome.serialize_bytes()).fitness == 0.0
+
+
+class TestPopulationSerialization:
+    """Test serialize_many/deserialize_many framing of populations."""
+
+    def test_round_trip_preserves_order_and_content(self):
+        """Populations round-trip in order with values and fitness intact."""
+        genomes = [
+            Genome().add_hyperparameter("lr", lr, "float").set_fitness(fitness)
+            for lr, fitness in ((0.01, 0.5), (0.02, 0.7), (0.03, 0.9))
+        ]
+
+        restored = Genome.deserialize_many(Genome.serialize_many(genomes))
+
+        assert [g.uuid for g in restored] == [g.uuid for g in genomes]
+        assert [g.as_hyperparameters()["lr"] for g in restored] == [0.01, 0.02, 0.03]
+        assert [g.fitness for g in restored] == [0.5, 0.7, 0.9]
+
+    def test_empty_population_round_trip(self):
+        """An empty population encodes to empty bytes and back."""
+        assert Genome.serialize_many([]) == b""
+        assert Genome.deserialize_many(b"") == []
+
+    def test_truncated_buffer_raises_error(self):
+        """A buffer cut partway through a frame raises ValueError."""
+        data = Genome.serialize_many([Genome().add_hyperparameter("lr", 0.01, "float")])
+
+        with pytest.raises(ValueError, match="Truncated"):
+            Genome.deserialize_many(data[:-1])
+        with pytest.raises(ValueError, match="Truncated"):
+            Genome.deserialize_many(data[:2])
+
+
+class TestContentHash:
+    """Test content_hash as a structural key over genetic content."""
+
+    def test_same_hyperparameters_hash_equal(self):
+        """Independently built genomes with the same alleles share a content hash."""
+        genome1 = Genome().add_hyperparameter("lr", 0.01, "float").set_fitness(0.9)
+        genome2 = Genome().add_hyperparameter("lr", 0.01, "float").set_metadata("note", 1)
+
+        assert genome1.uuid != genome2.uuid
+        assert genome1.content_hash == genome2.content_hash
+        assert len(genome1.content_hash) == 16
+
+    def test_different_values_hash_differently(self):
+        """Changing an allele value changes the content hash."""
+        genome1 = Genome().add_hyperparameter("lr", 0.01, "float")
+        genome2 = Genome().add_hyperparameter("lr", 0.02, "float")
+
+        assert genome1.content_hash != genome2.content_hash
+
+    def test_discrete_domain_order_does_not_matter(self):
+        """Discrete domains hash the same regardless of construction order."""
+        genome1 = Genome().add_hyperparameter(
+            "opt", "adam", "string", domain={"adam", "sgd", "rmsprop"}
+        )
+        genome2 = Genome().add_hyperparameter(
+            "opt", "adam", "string", domain={"rmsprop", "sgd", "adam"}
+        )
+
+        assert genome1.content_hash == genome2.content_hash
+
+    def test_survives_round_trip(self):
+        """Deserialized genomes keep their content hash."""
+        genome = Genome().add_hyperparameter(
+            "lr", 0.01, "float", metadata={"std": FloatAllele(0.1, can_mutate=False)}
+        )
+
+        restored = Genome.deserialize(genome.serialize())
+
+        assert restored.content_hash == genome.content_hash
+
+    def test_raw_metadata_lists_are_not_reordered(self):
+        """A raw metadata dict shaped like an allele keeps its list order in the hash."""
+        genome1 = Genome().add_hyperparameter(
+            "lr", 0.01, "float", metadata={"schedule": {"type": "step", "domain": [3, 1]}}
+        )
+        genome2 = Genome().add_hyperparameter(
+            "lr", 0.01, "float", metadata={"schedule": {"type": "step", "domain": [1, 3]}}
+        )
+
+        assert genome1.content_hash != genome2.content_hash
+
+    def test_unserializable_metadata_raises_error(self):
+        """Values with no stable serialized form raise TypeError instead of hashing."""
+        genome = Genome().add_hyperparameter("lr", 0.01, "float", metadata={"tag": object()})
+
+        with pytest.raises(TypeError):
+            genome.content_hash
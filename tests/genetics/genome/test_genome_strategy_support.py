@@ -1,7 +1,7 @@
 """
 Test suite for Genome strategy support methods.
 
-Tests with_alleles, with_ancestry, update_alleles, synthesize_new_alleles as thin
+Tests with_alleles, with_ancestry, update_alleles, synthesize_new_alleles and evolve as thin
 wrappers over module utilities.
 """
 
@@ -187,6 +187,57 @@ class TestUpdateAlleles:
         assert result.alleles["lr"].metadata["std"].value == 0.002
 
 
+    def test_update_alleles_reuses_alleles_the_predicate_skips(self):
+        """Alleles skipped by the predicate, with no changed descendants, are kept as-is."""
+        wd_allele = FloatAllele(
+            0.001, can_mutate=False, metadata={"std": FloatAllele(0.1, can_mutate=False)}
+        )
+        genome = Genome(alleles={"lr": FloatAllele(0.01), "wd": wd_allele})
+
+        def double(allele):
+            return allele.with_value(allele.value * 2)
+
+        result = genome.update_alleles(double, predicate=CanMutateFilter(True))
+
+        assert result.alleles["wd"] is wd_allele
+        assert result.alleles["lr"].value == 0.02
+
+    def test_update_alleles_rebuilds_skipped_parent_of_changed_child(self):
+        """A skipped allele whose nested allele changed is rebuilt around the new child."""
+        lr_allele = FloatAllele(0.01, can_mutate=False, metadata={"std": FloatAllele(0.001)})
+        genome = Genome(alleles={"lr": lr_allele})
+
+        def double(allele):
+            return allele.with_value(allele.value * 2)
+
+        result = genome.update_alleles(double, predicate=CanMutateFilter(True))
+
+        assert result.alleles["lr"] is not lr_allele
+        assert result.alleles["lr"].value == 0.01
+        assert result.alleles["lr"].metadata["std"].value == 0.002
+
+    def test_update_alleles_shares_allele_dict_when_nothing_changes(self):
+        """If no allele changes, the result shares the source alleles under a new UUID."""
+        genome = Genome().add_hyperparameter("lr", 0.01, "float", can_mutate=False)
+        genome = genome.add_hyperparameter("wd", 0.001, "float", can_mutate=False)
+
+        def double(allele):
+            return allele.with_value(allele.value * 2)
+
+        result = genome.update_alleles(double, predicate=CanMutateFilter(True))
+
+        assert all(result.alleles[name] is genome.alleles[name] for name in genome.alleles)
+        assert result.uuid != genome.uuid
+
+    def test_update_alleles_keeps_allele_when_handler_keeps_value(self):
+        """A handler that sets the current value again leaves the allele object as-is."""
+        lr_allele = FloatAllele(0.01, metadata={"note": "raw"})
+        genome = Genome(alleles={"lr": lr_allele})
+
+        result = genome.update_alleles(lambda allele: allele.with_value(allele.value))
+
+        assert result.alleles["lr"] is lr_allele
+
 class TestSynthesizeNewAlleles:
     """Test synthesize_new_alleles method (crossbreeding pattern)."""
 
@@ -292,6 +343,102 @@ class TestSynthesizeNewAlleles:
         with pytest.raises(ValueError, match="main_genome must be present"):
             genome1.synthesize_new_alleles([genome2], lambda t, s: t)
 
+    def test_synthesize_new_alleles_template_is_self_by_identity(self):
+        """The template slot is wherever self sits in the population."""
+        genome1 = Genome().add_hyperparameter("lr", 0.01, "float")
+        genome2 = Genome().add_hyperparameter("lr", 0.02, "float")
+
+        result = genome1.synthesize_new_alleles([genome2, genome1], lambda t, s: t)
+
+        assert result.alleles["lr"].value == 0.01
+
+
+class TestEvolve:
+    """Test evolve method (fused crossbreed, mutate and ancestry)."""
+
+    @staticmethod
+    def _average(template, sources):
+        return template.with_value(sum(s.value for s in sources) / len(sources))
+
+    @staticmethod
+    def _scale(allele):
+        return allele.with_value(allele.value * 1.1)
+
+    def test_evolve_matches_unfused_sequence(self):
+        """evolve gives the same values as crossbreed, then mutate, then ancestry."""
+        genome1 = Genome().add_hyperparameter("lr", 0.01, "float")
+        genome1 = genome1.add_hyperparameter("wd", 0.001, "float", can_mutate=False)
+        genome2 = Genome().add_hyperparameter("lr", 0.02, "float")
+        genome2 = genome2.add_hyperparameter("wd", 0.002, "float", can_mutate=False)
+        population = [genome1, genome2]
+        ancestry = [(0.6, genome1.uuid), (0.4, genome2.uuid)]
+
+        expected = genome1.synthesize_new_alleles(population, self._average)
+        expected = expected.update_alleles(self._scale, predicate=CanMutateFilter(True))
+        result = genome1.evolve(
+            population, self._average, self._scale, ancestry,
+            mutate_predicate=CanMutateFilter(True),
+        )
+
+        assert result.as_hyperparameters() == pytest.approx(expected.as_hyperparameters())
+        assert result.as_hyperparameters()["wd"] == pytest.approx(0.0015)
+
+    def test_evolve_records_ancestry_and_clears_fitness(self):
+        """evolve returns a new genome with parents set and no fitness."""
+        genome1 = Genome().add_hyperparameter("lr", 0.01, "float").set_fitness(0.9)
+        genome2 = Genome().add_hyperparameter("lr", 0.02, "float").set_fitness(0.8)
+        ancestry = [(1.0, genome1.uuid), (0.0, genome2.uuid)]
+
+        result = genome1.evolve([genome1, genome2], self._average, self._scale, ancestry)
+
+        assert result.parents == ancestry
+        assert result.fitness is None
+        assert result.uuid not in (genome1.uuid, genome2.uuid)
+
+    def test_evolve_respects_crossbreed_predicate(self):
+        """Alleles failing crossbreed_predicate keep the template value before mutation."""
+        from src.clan_tune.genetics.alleles import CanCrossbreedFilter
+
+        genome1 = Genome().add_hyperparameter("lr", 0.01, "float", can_crossbreed=False)
+        genome2 = Genome().add_hyperparameter("lr", 0.02, "float", can_crossbreed=False)
+
+        result = genome1.evolve(
+            [genome1, genome2], self._average, self._scale, [],
+            crossbreed_predicate=CanCrossbreedFilter(True),
+        )
+
+        assert result.as_hyperparameters()["lr"] == pytest.approx(0.011)
+
+    def test_evolve_matches_unfused_sequence_with_nested_alleles(self):
+        """Crossbreed handlers reading nested alleles see them crossbred but not yet mutated."""
+        genome1 = Genome().add_hyperparameter(
+            "lr", 1.0, "float", metadata={"std": FloatAllele(0.1)}
+        )
+        genome2 = Genome().add_hyperparameter(
+            "lr", 3.0, "float", metadata={"std": FloatAllele(0.3)}
+        )
+        population = [genome1, genome2]
+
+        def crossbreed(template, sources):
+            value = sum(s.value for s in sources) / len(sources)
+            if "std" in template.metadata:
+                value += 10 * template.metadata["std"]
+            return template.with_value(value)
+
+        def mutate(allele):
+            return allele.with_value(allele.value * 2)
+
+        expected = genome1.synthesize_new_alleles(population, crossbreed)
+        expected = expected.update_alleles(mutate)
+        result = genome1.evolve(population, crossbreed, mutate, [(1.0, genome1.uuid)])
+
+        assert result.as_hyperparameters() == pytest.approx(expected.as_hyperparameters())
+        assert result.alleles["lr"].metadata["std"].value == pytest.approx(
+            expected.alleles["lr"].metadata["std"].value
+        )
+        assert result.parents == [(1.0, genome1.uuid)]
+        assert result.fitness is None
+
 
 class TestStrategyWorkflow:
     """Test typical strategy usage patterns."""
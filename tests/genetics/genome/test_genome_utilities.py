@@ -7,7 +7,12 @@ synthesis behavior, and delegation to allele utilities.
 
 import pytest
 from uuid import UUID
-from src.clan_tune.genetics.genome import Genome, walk_genome_alleles, synthesize_genomes
+from src.clan_tune.genetics.genome import (
+    Genome,
+    pack_population,
+    walk_genome_alleles,
+    synthesize_genomes,
+)
 from src.clan_tune.genetics.alleles import FloatAllele, IntAllele, CanMutateFilter
 
 
@@ -139,6 +144,36 @@ class TestWalkGenomeAlleles:
         with pytest.raises(ValueError, match="same hyperparameter keys"):
             list(walk_genome_alleles([genome1, genome2], lambda a: a[0].value))
 
+    def test_walk_key_check_ignores_insertion_order(self):
+        """Genomes with the same keys added in different orders walk together."""
+        genome1 = Genome().add_hyperparameter("lr", 0.01, "float").add_hyperparameter("wd", 0.1, "float")
+        genome2 = Genome().add_hyperparameter("wd", 0.2, "float").add_hyperparameter("lr", 0.02, "float")
+
+        results = list(walk_genome_alleles([genome1, genome2], lambda a: a[1].value))
+
+        assert results == [0.02, 0.2]
+
+    def test_walk_detects_keys_added_to_derived_genome(self):
+        """A genome derived from a population member and then extended is rejected."""
+        genome1 = Genome().add_hyperparameter("lr", 0.01, "float")
+        offspring = synthesize_genomes(genome1, [genome1], lambda t, s: t).set_fitness(1.0)
+        extended = offspring.add_hyperparameter("wd", 0.1, "float")
+
+        list(walk_genome_alleles([genome1, offspring], lambda a: None))
+        with pytest.raises(ValueError, match="same hyperparameter keys"):
+            list(walk_genome_alleles([genome1, extended], lambda a: None))
+
+    def test_walk_key_check_repeats_consistently(self):
+        """Independently built genomes pass repeated checks; extending one is still caught."""
+        genome1 = Genome().add_hyperparameter("lr", 0.01, "float")
+        genome2 = Genome().add_hyperparameter("lr", 0.02, "float")
+
+        for _ in range(2):
+            assert list(walk_genome_alleles([genome1, genome2], lambda a: a[1].value)) == [0.02]
+        extended = genome2.add_hyperparameter("wd", 0.1, "float")
+        with pytest.raises(ValueError, match="same hyperparameter keys"):
+            list(walk_genome_alleles([genome1, extended], lambda a: None))
+
 
 class TestSynthesizeGenomes:
     """Test synthesize_genomes utility function."""
@@ -184,6 +219,21 @@ class TestSynthesizeGenomes:
 
         assert result.parents is None
 
+    def test_synthesize_records_given_parents(self):
+        """synthesize_genomes attaches parents when given, in both rebuild paths."""
+        genome1 = Genome().add_hyperparameter("lr", 0.01, "float")
+        genome2 = Genome().add_hyperparameter("lr", 0.02, "float")
+        ancestry = [(0.5, genome1.uuid), (0.5, genome2.uuid)]
+
+        changed = synthesize_genomes(
+            genome1, [genome1, genome2], lambda t, s: t.with_value(0.03), parents=ancestry
+        )
+        unchanged = synthesize_genomes(genome1, [genome1], lambda t, s: t, parents=ancestry)
+
+        assert changed.parents == ancestry
+        assert unchanged.parents == ancestry
+        assert changed.fitness is None
+
     def test_synthesize_with_kwargs(self):
         """synthesize_genomes passes kwargs to handler."""
         genome1 = Genome().add_hyperparameter("lr", 0.01, "float")
@@ -294,6 +344,79 @@ class TestSynthesizeGenomes:
             synthesize_genomes(genome1, [genome1, genome2], lambda t, s: t)
 
 
+class TestPackPopulation:
+    """Test suite for pack_population utility."""
+
+    def test_pack_one_array_per_hyperparameter(self):
+        """Each hyperparameter maps to its values across the population, in order."""
+        genomes = [
+            Genome().add_hyperparameter("lr", 0.1, "float").add_hyperparameter("layers", 2, "int"),
+            Genome().add_hyperparameter("lr", 0.2, "float").add_hyperparameter("layers", 3, "int"),
+            Genome().add_hyperparameter("lr", 0.3, "float").add_hyperparameter("layers", 4, "int"),
+        ]
+
+        packed = pack_population(genomes)
+
+        assert set(packed.keys()) == {"lr", "layers"}
+        assert packed["lr"].tolist() == [0.1, 0.2, 0.3]
+        assert packed["layers"].tolist() == [2, 3, 4]
+
+    def test_pack_ignores_nested_alleles(self):
+        """Only top-level values are packed."""
+        genomes = [
+            Genome(alleles={"lr": FloatAllele(0.01, metadata={"std": FloatAllele(0.5)})}),
+            Genome(alleles={"lr": FloatAllele(0.02, metadata={"std": FloatAllele(0.6)})}),
+        ]
+
+        packed = pack_population(genomes)
+
+        assert list(packed.keys()) == ["lr"]
+        assert packed["lr"].shape == (2,)
+
+    def test_pack_empty_population_raises_error(self):
+        """Raises ValueError for an empty population."""
+        with pytest.raises(ValueError):
+            pack_population([])
+
+    def test_pack_mismatched_hyperparameters_raises_error(self):
+        """Raises ValueError when genomes have different hyperparameters."""
+        genome1 = Genome().add_hyperparameter("lr", 0.01, "float")
+        genome2 = Genome().add_hyperparameter("wd", 0.001, "float")
+
+        with pytest.raises(ValueError, match="same hyperparameter keys"):
+            pack_population([genome1, genome2])
+
+    def test_packed_reduction_matches_walk(self):
+        """Reducing packed arrays gives the same population mean as walking alleles."""
+        genomes = [Genome().add_hyperparameter("lr", lr, "float") for lr in (0.01, 0.02, 0.06)]
+
+        def mean_handler(alleles):
+            return sum(a.value for a in alleles) / len(alleles)
+
+        walked = list(walk_genome_alleles(genomes, mean_handler))
+
+        assert pack_population(genomes)["lr"].mean() == pytest.approx(walked[0])
+
+    def test_pack_float_dtype_applies_to_float_hyperparameters_only(self):
+        """float_dtype narrows float and log-float arrays, leaving other types inferred."""
+        import numpy
+
+        genomes = [
+            Genome()
+            .add_hyperparameter("lr", lr, "logfloat", domain={"min": 1e-6, "max": 1.0})
+            .add_hyperparameter("wd", 0.01, "float")
+            .add_hyperparameter("layers", 2, "int")
+            for lr in (0.001, 0.01)
+        ]
+
+        packed = pack_population(genomes, float_dtype=numpy.float32)
+
+        assert packed["lr"].dtype == numpy.float32
+        assert packed["wd"].dtype == numpy.float32
+        assert packed["layers"].dtype.kind == "i"
+        assert packed["lr"].tolist() == pytest.approx([0.001, 0.01])
+
+
 class TestHandlerAdaptation:
     """Test that handlers receive kwargs correctly (delegation contract)."""
 
@@ -318,3 +441,25 @@ class TestHandlerAdaptation:
         result = synthesize_genomes(genome1, [genome1], multi_kwarg_handler, kwargs={'scale': 10.0, 'offset': 5.0})
 
         assert result.as_hyperparameters()["lr"] == 0.1 + 5.0
+
+
+class TestParentsArray:
+    """Test suite for Genome.parents_array."""
+
+    def test_columns_follow_parents_in_rank_order(self):
+        """Probabilities and raw UUID bytes match parents, rank by rank."""
+        first = UUID("00000000-0000-0000-0000-000000000100")
+        second = UUID("22222222-2222-2222-2222-222222222222")
+        genome = Genome(parents=[(0.25, first), (0.75, second)])
+
+        packed = genome.parents_array()
+
+        assert packed["probability"].tolist() == [0.25, 0.75]
+        assert [UUID(bytes=entry.tobytes()) for entry in packed["uuid"]] == [first, second]
+
+    def test_no_parents_gives_empty_array(self):
+        """Genomes without ancestry produce an empty array with the same fields."""
+        packed = Genome().parents_array()
+
+        assert packed.shape == (0,)
+        assert packed.dtype.names == ("probability", "uuid")
@@ -22,7 +22,7 @@ class MinimalAncestryStrategy(AbstractAncestryStrategy):
         """Minimal implementation: self-reproduce."""
         ancestry = []
         for genome in population:
-            if genome == my_genome:
+            if genome is my_genome:
                 prob = 1.0
             else:
                 prob = 0.0
@@ -84,6 +84,16 @@ def test_apply_strategy_validates_my_genome_in_population():
         strategy.apply_strategy(genome1, [genome2])  # genome1 not in list
 
 
+def test_apply_strategy_does_not_match_my_genome_by_uuid():
+    """A different genome sharing my_genome's UUID does not count as my_genome."""
+    strategy = MinimalAncestryStrategy()
+    genome1 = Genome(alleles={"lr": FloatAllele(0.01)}).with_overrides(fitness=0.5)
+    rescored = genome1.set_fitness(0.9)
+
+    with pytest.raises(ValueError, match="my_genome must be in population"):
+        strategy.apply_strategy(genome1, [rescored])
+
+
 def test_apply_strategy_validates_ancestry_length():
     """apply_strategy raises ValueError if ancestry length doesn't match population."""
 
@@ -200,7 +210,7 @@ def test_select_ancestry_receives_my_genome_and_population():
         def select_ancestry(self, my_genome, population):
             self.received_my_genome = my_genome
             self.received_population = population
-            return [(1.0, my_genome.uuid)] + [(0.0, g.uuid) for g in population if g != my_genome]
+            return [(1.0, my_genome.uuid)] + [(0.0, g.uuid) for g in population if g is not my_genome]
 
     strategy = InspectingStrategy()
     genome1 = Genome(alleles={"lr": FloatAllele(0.01)})
@@ -239,3 +249,30 @@ def test_ancestry_uses_fitness_for_selection():
     # Best genome (lowest fitness) gets 1.0
     assert ancestry[0] == (1.0, genome1.uuid)
     assert ancestry[1] == (0.0, genome2.uuid)
+
+
+def test_apply_strategy_many_matches_per_genome_calls():
+    """apply_strategy_many returns the same ancestries as apply_strategy, in order."""
+    strategy = MinimalAncestryStrategy()
+    population = [
+        Genome(alleles={"lr": FloatAllele(0.01 * i)}).with_overrides(fitness=0.1 * i)
+        for i in range(1, 5)
+    ]
+    my_genomes = [population[2], population[0], population[2]]
+
+    ancestries = strategy.apply_strategy_many(my_genomes, population)
+
+    assert ancestries == [strategy.apply_strategy(g, population) for g in my_genomes]
+
+
+def test_apply_strategy_many_validates_population_and_members():
+    """apply_strategy_many raises for missing fitness or genomes outside the population."""
+    strategy = MinimalAncestryStrategy()
+    genome1 = Genome(alleles={"lr": FloatAllele(0.01)}).with_overrides(fitness=0.5)
+    genome2 = Genome(alleles={"lr": FloatAllele(0.02)})
+    outsider = genome1.with_overrides()
+
+    with pytest.raises(ValueError, match="fitness"):
+        strategy.apply_strategy_many([genome1], [genome1, genome2])
+    with pytest.raises(ValueError, match="population"):
+        strategy.apply_strategy_many([genome1, outsider], [genome1])
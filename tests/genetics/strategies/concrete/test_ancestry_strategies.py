@@ -8,7 +8,9 @@ with exact computations.
 """
 
 import math
-from typing import List
+from operator import attrgetter
+from typing import Dict, List, Tuple
+from uuid import UUID
 
 import pytest
 
@@ -35,6 +37,20 @@ def make_population(*fitnesses: float) -> List[Genome]:
     return [make_genome(f) for f in fitnesses]
 
 
+def _probs(ancestry: List[Tuple[float, UUID]]) -> Dict[UUID, float]:
+    """Map each uuid in an ancestry declaration to its probability."""
+    probabilities, uuids = zip(*ancestry)
+    return dict(zip(uuids, probabilities))
+
+
+def _assert_others_zero(
+    probs: Dict[UUID, float], population: List[Genome], *nonzero_genomes: Genome
+) -> None:
+    """Assert every genome in population other than nonzero_genomes has probability 0."""
+    excluded = {genome.uuid for genome in nonzero_genomes}
+    assert all(probs[g.uuid] == 0.0 for g in population if g.uuid not in excluded)
+
+
 class _DeterministicTournament(TournamentSelection):
     """
     Test subclass overriding _choose for deterministic algorithm verification.
@@ -46,10 +62,52 @@ class _DeterministicTournament(TournamentSelection):
 
     def __init__(self, index_sequence, **kwargs):
         super().__init__(**kwargs)
-        self._it = iter(index_sequence)
+        self._indices = tuple(index_sequence)
+        self._calls = 0
 
     def _choose(self, population):
-        return population[next(self._it)]
+        index = self._indices[self._calls]
+        self._calls += 1
+        return population[index]
+
+
+# --- Shared output structure ---
+
+
+SELECTION_STRATEGIES = [
+    pytest.param(lambda: TournamentSelection(), id="tournament"),
+    pytest.param(lambda: EliteBreeds(thrive_count=1, die_count=1), id="elite"),
+    pytest.param(lambda: RankSelection(), id="rank"),
+    pytest.param(lambda: BoltzmannSelection(), id="boltzmann"),
+]
+
+
+@pytest.mark.parametrize("make_strategy", SELECTION_STRATEGIES)
+class TestSelectionStrategyOutputStructure:
+    """Tests that every selection strategy returns correctly structured ancestry declarations."""
+
+    def test_output_length_equals_population_size(self, make_strategy):
+        population = make_population(1.0, 2.0, 3.0, 4.0)
+        ancestry = make_strategy().select_ancestry(population[0], population)
+        assert len(ancestry) == len(population)
+
+    def test_uuid_at_index_matches_population_genome(self, make_strategy):
+        population = make_population(1.0, 2.0, 3.0, 4.0)
+        ancestry = make_strategy().select_ancestry(population[0], population)
+        for i, (prob, uuid) in enumerate(ancestry):
+            assert uuid == population[i].uuid
+
+    def test_probabilities_are_nonnegative(self, make_strategy):
+        population = make_population(1.0, 2.0, 3.0, 4.0)
+        ancestry = make_strategy().select_ancestry(population[0], population)
+        assert all(prob >= 0.0 for prob, _ in ancestry)
+
+    def test_probabilities_sum_to_one(self, make_strategy):
+        population = make_population(1.0, 2.0, 3.0, 4.0)
+        for genome in population:
+            ancestry = make_strategy().select_ancestry(genome, population)
+            probabilities = [prob for prob, _ in ancestry]
+            assert math.isclose(math.fsum(probabilities), 1.0, abs_tol=1e-9)
 
 
 # --- TournamentSelection ---
@@ -76,36 +134,6 @@ class TestTournamentSelectionConstructorValidation:
         assert strategy.num_tournaments == 7
 
 
-class TestTournamentSelectionOutputStructure:
-    """Tests that select_ancestry returns correctly structured ancestry declarations."""
-
-    def test_output_length_equals_population_size(self):
-        population = make_population(1.0, 2.0, 3.0)
-        strategy = TournamentSelection()
-        ancestry = strategy.select_ancestry(population[0], population)
-        assert len(ancestry) == len(population)
-
-    def test_uuid_at_index_matches_population_genome(self):
-        population = make_population(1.0, 2.0, 3.0)
-        strategy = TournamentSelection()
-        ancestry = strategy.select_ancestry(population[0], population)
-        for i, (prob, uuid) in enumerate(ancestry):
-            assert uuid == population[i].uuid
-
-    def test_probabilities_are_nonnegative(self):
-        population = make_population(1.0, 2.0, 3.0)
-        strategy = TournamentSelection()
-        ancestry = strategy.select_ancestry(population[0], population)
-        assert all(prob >= 0.0 for prob, _ in ancestry)
-
-    def test_probabilities_sum_to_one(self):
-        population = make_population(1.0, 2.0, 3.0)
-        strategy = TournamentSelection()
-        ancestry = strategy.select_ancestry(population[0], population)
-        total = sum(prob for prob, _ in ancestry)
-        assert abs(total - 1.0) < 1e-9
-
-
 class TestTournamentSelectionProbabilityMath:
     """Tests that win counts translate correctly to probabilities via win_count / num_tournaments."""
 
@@ -116,7 +144,7 @@ class TestTournamentSelectionProbabilityMath:
         strategy = _DeterministicTournament([0, 1, 0, 2], tournament_size=2, num_tournaments=2)
         ancestry = strategy.select_ancestry(population[0], population)
 
-        probs = {uuid: prob for prob, uuid in ancestry}
+        probs = _probs(ancestry)
         assert probs[population[0].uuid] == 1.0
         assert probs[population[1].uuid] == 0.0
         assert probs[population[2].uuid] == 0.0
@@ -128,7 +156,7 @@ class TestTournamentSelectionProbabilityMath:
         strategy = _DeterministicTournament([0, 1, 1, 2], tournament_size=2, num_tournaments=2)
         ancestry = strategy.select_ancestry(population[0], population)
 
-        probs = {uuid: prob for prob, uuid in ancestry}
+        probs = _probs(ancestry)
         assert probs[population[0].uuid] == 0.5
         assert probs[population[1].uuid] == 0.5
         assert probs[population[2].uuid] == 0.0
@@ -141,7 +169,7 @@ class TestTournamentSelectionProbabilityMath:
         strategy = _DeterministicTournament([0, 1, 0, 2, 0, 1, 1, 2], tournament_size=2, num_tournaments=4)
         ancestry = strategy.select_ancestry(population[0], population)
 
-        probs = {uuid: prob for prob, uuid in ancestry}
+        probs = _probs(ancestry)
         assert abs(probs[population[0].uuid] - 0.75) < 1e-9
         assert abs(probs[population[1].uuid] - 0.25) < 1e-9
         assert probs[population[2].uuid] == 0.0
@@ -152,7 +180,7 @@ class TestTournamentSelectionProbabilityMath:
         strategy = _DeterministicTournament([0] * 8, tournament_size=2, num_tournaments=4)
         ancestry = strategy.select_ancestry(population[0], population)
 
-        probs = {uuid: prob for prob, uuid in ancestry}
+        probs = _probs(ancestry)
         assert probs[population[0].uuid] == 1.0
 
     def test_original_population_order_preserved_in_output(self):
@@ -165,7 +193,7 @@ class TestTournamentSelectionProbabilityMath:
         for i, (prob, uuid) in enumerate(ancestry):
             assert uuid == population[i].uuid
 
-        probs = {uuid: prob for prob, uuid in ancestry}
+        probs = _probs(ancestry)
         assert probs[population[1].uuid] == 1.0
 
     def test_my_genome_does_not_affect_selection_outcome(self):
@@ -178,8 +206,8 @@ class TestTournamentSelectionProbabilityMath:
         strategy2 = _DeterministicTournament([0, 1, 0, 2], tournament_size=2, num_tournaments=2)
         ancestry2 = strategy2.select_ancestry(population[2], population)
 
-        probs1 = {uuid: prob for prob, uuid in ancestry1}
-        probs2 = {uuid: prob for prob, uuid in ancestry2}
+        probs1 = _probs(ancestry1)
+        probs2 = _probs(ancestry2)
         assert probs1 == probs2
 
 
@@ -208,31 +236,6 @@ class TestEliteBreedsValidation:
         assert len(ancestry) == 4
 
 
-class TestEliteBreedsOutputStructure:
-    """Tests structural contracts of EliteBreeds ancestry output."""
-
-    def test_output_length_equals_population_size(self):
-        population = make_population(1.0, 2.0, 3.0, 4.0, 5.0)
-        strategy = EliteBreeds(thrive_count=1, die_count=1)
-        ancestry = strategy.select_ancestry(population[0], population)
-        assert len(ancestry) == 5
-
-    def test_uuid_at_index_matches_population_genome(self):
-        population = make_population(1.0, 2.0, 3.0, 4.0)
-        strategy = EliteBreeds(thrive_count=1, die_count=1)
-        ancestry = strategy.select_ancestry(population[0], population)
-        for i, (prob, uuid) in enumerate(ancestry):
-            assert uuid == population[i].uuid
-
-    def test_probabilities_sum_to_one(self):
-        population = make_population(1.0, 2.0, 3.0, 4.0)
-        for genome in population:
-            strategy = EliteBreeds(thrive_count=1, die_count=1)
-            ancestry = strategy.select_ancestry(genome, population)
-            total = sum(prob for prob, _ in ancestry)
-            assert abs(total - 1.0) < 1e-9
-
-
 class TestEliteBreedsTierBehavior:
     """Tests that each tier receives the correct ancestry probabilities."""
 
@@ -243,10 +246,10 @@ class TestEliteBreedsTierBehavior:
         strategy = EliteBreeds(thrive_count=1, die_count=1)
 
         ancestry = strategy.select_ancestry(thrive_genome, population)
-        probs = {uuid: prob for prob, uuid in ancestry}
+        probs = _probs(ancestry)
 
         assert probs[thrive_genome.uuid] == 1.0
-        assert all(probs[g.uuid] == 0.0 for g in population if g is not thrive_genome)
+        _assert_others_zero(probs, population, thrive_genome)
 
     def test_survive_genome_self_reproduces(self):
         # Population fitness: [1.0, 2.0, 3.0, 4.0]; survive=genome[1], genome[2]
@@ -255,10 +258,10 @@ class TestEliteBreedsTierBehavior:
         strategy = EliteBreeds(thrive_count=1, die_count=1)
 
         ancestry = strategy.select_ancestry(survive_genome, population)
-        probs = {uuid: prob for prob, uuid in ancestry}
+        probs = _probs(ancestry)
 
         assert probs[survive_genome.uuid] == 1.0
-        assert all(probs[g.uuid] == 0.0 for g in population if g is not survive_genome)
+        _assert_others_zero(probs, population, survive_genome)
 
     def test_die_genome_receives_equal_probability_from_thrive(self):
         # thrive_count=2: die genome gets 0.5 from each thrive member
@@ -268,11 +271,11 @@ class TestEliteBreedsTierBehavior:
         strategy = EliteBreeds(thrive_count=2, die_count=1)
 
         ancestry = strategy.select_ancestry(die_genome, population)
-        probs = {uuid: prob for prob, uuid in ancestry}
+        probs = _probs(ancestry)
 
         assert abs(probs[thrive_genomes[0].uuid] - 0.5) < 1e-9
         assert abs(probs[thrive_genomes[1].uuid] - 0.5) < 1e-9
-        assert probs[die_genome.uuid] == 0.0
+        _assert_others_zero(probs, population, *thrive_genomes)
 
     def test_die_genome_with_three_thrive_gets_one_third_each(self):
         population = make_population(1.0, 2.0, 3.0, 4.0, 5.0, 6.0)
@@ -281,7 +284,7 @@ class TestEliteBreedsTierBehavior:
         strategy = EliteBreeds(thrive_count=3, die_count=1)
 
         ancestry = strategy.select_ancestry(die_genome, population)
-        probs = {uuid: prob for prob, uuid in ancestry}
+        probs = _probs(ancestry)
 
         for thrive_genome in thrive_genomes:
             assert abs(probs[thrive_genome.uuid] - 1.0 / 3.0) < 1e-9
@@ -300,9 +303,9 @@ class TestEliteBreedsTierBehavior:
         die_ancestry = strategy.select_ancestry(die_genome, population)
         survive_ancestry = strategy.select_ancestry(survive_genome, population)
 
-        thrive_probs = {uuid: prob for prob, uuid in thrive_ancestry}
-        die_probs = {uuid: prob for prob, uuid in die_ancestry}
-        survive_probs = {uuid: prob for prob, uuid in survive_ancestry}
+        thrive_probs = _probs(thrive_ancestry)
+        die_probs = _probs(die_ancestry)
+        survive_probs = _probs(survive_ancestry)
 
         assert thrive_probs[thrive_genome.uuid] == 1.0
         assert survive_probs[survive_genome.uuid] == 1.0
@@ -335,36 +338,6 @@ class TestRankSelectionConstructorValidation:
         assert strategy.selection_pressure == 1.0
 
 
-class TestRankSelectionOutputStructure:
-    """Tests structural contracts of RankSelection ancestry output."""
-
-    def test_output_length_equals_population_size(self):
-        population = make_population(1.0, 2.0, 3.0, 4.0)
-        strategy = RankSelection()
-        ancestry = strategy.select_ancestry(population[0], population)
-        assert len(ancestry) == len(population)
-
-    def test_uuid_at_index_matches_population_genome(self):
-        population = make_population(1.0, 2.0, 3.0)
-        strategy = RankSelection()
-        ancestry = strategy.select_ancestry(population[0], population)
-        for i, (prob, uuid) in enumerate(ancestry):
-            assert uuid == population[i].uuid
-
-    def test_probabilities_sum_to_one(self):
-        population = make_population(1.0, 2.0, 3.0, 4.0)
-        strategy = RankSelection()
-        ancestry = strategy.select_ancestry(population[0], population)
-        total = sum(prob for prob, _ in ancestry)
-        assert abs(total - 1.0) < 1e-9
-
-    def test_probabilities_are_nonnegative(self):
-        population = make_population(1.0, 2.0, 3.0, 4.0)
-        strategy = RankSelection()
-        ancestry = strategy.select_ancestry(population[0], population)
-        assert all(prob >= 0.0 for prob, _ in ancestry)
-
-
 class TestRankSelectionProbabilityMath:
     """Tests that rank weights and normalization are computed correctly across all genomes."""
 
@@ -381,8 +354,8 @@ class TestRankSelectionProbabilityMath:
         strategy = RankSelection(selection_pressure=1.0)
         ancestry = strategy.select_ancestry(population[0], population)
 
-        sorted_pop = sorted(population, key=lambda g: g.fitness)
-        probs = {uuid: prob for prob, uuid in ancestry}
+        sorted_pop = sorted(population, key=attrgetter("fitness"))
+        probs = _probs(ancestry)
 
         assert abs(probs[sorted_pop[0].uuid] - 4 / 10) < 1e-9
         assert abs(probs[sorted_pop[1].uuid] - 3 / 10) < 1e-9
@@ -396,8 +369,8 @@ class TestRankSelectionProbabilityMath:
         strategy = RankSelection(selection_pressure=2.0)
         ancestry = strategy.select_ancestry(population[0], population)
 
-        sorted_pop = sorted(population, key=lambda g: g.fitness)
-        probs = {uuid: prob for prob, uuid in ancestry}
+        sorted_pop = sorted(population, key=attrgetter("fitness"))
+        probs = _probs(ancestry)
 
         assert abs(probs[sorted_pop[0].uuid] - 16 / 30) < 1e-9
         assert abs(probs[sorted_pop[1].uuid] - 9 / 30) < 1e-9
@@ -406,7 +379,7 @@ class TestRankSelectionProbabilityMath:
 
     def test_higher_pressure_increases_top_genome_share(self):
         population = make_population(1.0, 2.0, 3.0, 4.0)
-        sorted_pop = sorted(population, key=lambda g: g.fitness)
+        sorted_pop = sorted(population, key=attrgetter("fitness"))
         best_uuid = sorted_pop[0].uuid
 
         low_pressure = RankSelection(selection_pressure=0.5)
@@ -415,8 +388,8 @@ class TestRankSelectionProbabilityMath:
         low_ancestry = low_pressure.select_ancestry(population[0], population)
         high_ancestry = high_pressure.select_ancestry(population[0], population)
 
-        low_probs = {uuid: prob for prob, uuid in low_ancestry}
-        high_probs = {uuid: prob for prob, uuid in high_ancestry}
+        low_probs = _probs(low_ancestry)
+        high_probs = _probs(high_ancestry)
 
         assert high_probs[best_uuid] > low_probs[best_uuid]
 
@@ -427,8 +400,8 @@ class TestRankSelectionProbabilityMath:
         ancestry_from_best = strategy.select_ancestry(population[0], population)
         ancestry_from_worst = strategy.select_ancestry(population[3], population)
 
-        probs_best = {uuid: prob for prob, uuid in ancestry_from_best}
-        probs_worst = {uuid: prob for prob, uuid in ancestry_from_worst}
+        probs_best = _probs(ancestry_from_best)
+        probs_worst = _probs(ancestry_from_worst)
 
         assert probs_best == probs_worst
 
@@ -447,12 +420,20 @@ class TestRankSelectionProbabilityMath:
         strategy = RankSelection(selection_pressure=1.0)
         ancestry = strategy.select_ancestry(population[0], population)
 
-        probs = {uuid: prob for prob, uuid in ancestry}
+        probs = _probs(ancestry)
         assert all(
             probs[best_genome.uuid] >= probs[g.uuid]
             for g in population
         )
 
+    def test_genomes_sharing_uuid_weighted_by_position(self):
+        # Rescored copy keeps its uuid (set_fitness); each position still gets its own weight
+        original = make_genome(2.0)
+        population = [original, original.set_fitness(1.0)]
+        ancestry = RankSelection().select_ancestry(population[0], population)
+
+        assert [prob for prob, _ in ancestry] == [1 / 3, 2 / 3]
+
 
 # --- BoltzmannSelection ---
 
@@ -473,36 +454,6 @@ class TestBoltzmannSelectionConstructorValidation:
         assert strategy.temperature == 1.0
 
 
-class TestBoltzmannSelectionOutputStructure:
-    """Tests structural contracts of BoltzmannSelection ancestry output."""
-
-    def test_output_length_equals_population_size(self):
-        population = make_population(1.0, 2.0, 3.0)
-        strategy = BoltzmannSelection()
-        ancestry = strategy.select_ancestry(population[0], population)
-        assert len(ancestry) == len(population)
-
-    def test_uuid_at_index_matches_population_genome(self):
-        population = make_population(1.0, 2.0, 3.0)
-        strategy = BoltzmannSelection()
-        ancestry = strategy.select_ancestry(population[0], population)
-        for i, (prob, uuid) in enumerate(ancestry):
-            assert uuid == population[i].uuid
-
-    def test_probabilities_sum_to_one(self):
-        population = make_population(1.0, 2.0, 3.0)
-        strategy = BoltzmannSelection()
-        ancestry = strategy.select_ancestry(population[0], population)
-        total = sum(prob for prob, _ in ancestry)
-        assert abs(total - 1.0) < 1e-9
-
-    def test_probabilities_are_nonnegative(self):
-        population = make_population(1.0, 2.0, 3.0)
-        strategy = BoltzmannSelection()
-        ancestry = strategy.select_ancestry(population[0], population)
-        assert all(prob >= 0.0 for prob, _ in ancestry)
-
-
 class TestBoltzmannSelectionProbabilityMath:
     """Tests that Boltzmann weights are computed correctly across all genomes."""
 
@@ -519,20 +470,20 @@ class TestBoltzmannSelectionProbabilityMath:
         strategy = BoltzmannSelection(temperature=1.0)
         ancestry = strategy.select_ancestry(population[0], population)
 
-        sorted_pop = sorted(population, key=lambda g: g.fitness)
+        sorted_pop = sorted(population, key=attrgetter("fitness"))
         w0 = math.exp(-1.0)
         w1 = math.exp(-2.0)
         w2 = math.exp(-3.0)
         total = w0 + w1 + w2
 
-        probs = {uuid: prob for prob, uuid in ancestry}
+        probs = _probs(ancestry)
         assert abs(probs[sorted_pop[0].uuid] - w0 / total) < 1e-9
         assert abs(probs[sorted_pop[1].uuid] - w1 / total) < 1e-9
         assert abs(probs[sorted_pop[2].uuid] - w2 / total) < 1e-9
 
     def test_lower_temperature_concentrates_probability_on_best(self):
         population = make_population(1.0, 2.0, 3.0, 4.0)
-        sorted_pop = sorted(population, key=lambda g: g.fitness)
+        sorted_pop = sorted(population, key=attrgetter("fitness"))
         best_uuid = sorted_pop[0].uuid
 
         high_temp = BoltzmannSelection(temperature=100.0)
@@ -541,19 +492,19 @@ class TestBoltzmannSelectionProbabilityMath:
         high_ancestry = high_temp.select_ancestry(population[0], population)
         low_ancestry = low_temp.select_ancestry(population[0], population)
 
-        high_probs = {uuid: prob for prob, uuid in high_ancestry}
-        low_probs = {uuid: prob for prob, uuid in low_ancestry}
+        high_probs = _probs(high_ancestry)
+        low_probs = _probs(low_ancestry)
 
         assert low_probs[best_uuid] > high_probs[best_uuid]
 
     def test_temperature_affects_distribution_among_all_genomes(self):
         # At high temp, all genomes should have similar probabilities
         population = make_population(1.0, 2.0, 3.0)
-        sorted_pop = sorted(population, key=lambda g: g.fitness)
+        sorted_pop = sorted(population, key=attrgetter("fitness"))
 
         high_temp = BoltzmannSelection(temperature=1000.0)
         high_ancestry = high_temp.select_ancestry(population[0], population)
-        high_probs = {uuid: prob for prob, uuid in high_ancestry}
+        high_probs = _probs(high_ancestry)
 
         # At high temp, ratio of top two probs approaches 1.0
         ratio = high_probs[sorted_pop[1].uuid] / high_probs[sorted_pop[0].uuid]
@@ -566,8 +517,8 @@ class TestBoltzmannSelectionProbabilityMath:
         ancestry_from_best = strategy.select_ancestry(population[0], population)
         ancestry_from_worst = strategy.select_ancestry(population[2], population)
 
-        probs_best = {uuid: prob for prob, uuid in ancestry_from_best}
-        probs_worst = {uuid: prob for prob, uuid in ancestry_from_worst}
+        probs_best = _probs(ancestry_from_best)
+        probs_worst = _probs(ancestry_from_worst)
 
         assert probs_best == probs_worst
 
@@ -578,6 +529,15 @@ class TestBoltzmannSelectionProbabilityMath:
         for i, (prob, uuid) in enumerate(ancestry):
             assert uuid == population[i].uuid
 
+    def test_genomes_sharing_uuid_weighted_by_position(self):
+        # Rescored copy keeps its uuid (set_fitness); probabilities still sum to one
+        original = make_genome(2.0)
+        population = [original, original.set_fitness(1.0)]
+        ancestry = BoltzmannSelection().select_ancestry(population[0], population)
+
+        assert ancestry[1][0] > ancestry[0][0]
+        assert abs(sum(prob for prob, _ in ancestry) - 1.0) < 1e-9
+
 
 # --- TopN ---
 
@@ -620,8 +580,8 @@ class TestTopNOutputStructure:
         population = make_population(1.0, 2.0, 3.0, 4.0)
         wrapper = TopN(n=2, strategy=RankSelection())
         ancestry = wrapper.select_ancestry(population[0], population)
-        total = sum(prob for prob, _ in ancestry)
-        assert abs(total - 1.0) < 1e-9
+        probabilities = [prob for prob, _ in ancestry]
+        assert math.isclose(math.fsum(probabilities), 1.0, abs_tol=1e-9)
 
 
 class TestTopNClippingBehavior:
@@ -637,11 +597,11 @@ class TestTopNClippingBehavior:
     def test_top_n_by_probability_preserved(self):
         # RankSelection gives best genome highest prob; TopN(2) keeps top 2
         population = make_population(1.0, 2.0, 3.0, 4.0)
-        sorted_pop = sorted(population, key=lambda g: g.fitness)
+        sorted_pop = sorted(population, key=attrgetter("fitness"))
         wrapper = TopN(n=2, strategy=RankSelection(selection_pressure=1.0))
         ancestry = wrapper.select_ancestry(population[0], population)
 
-        probs = {uuid: prob for prob, uuid in ancestry}
+        probs = _probs(ancestry)
         assert probs[sorted_pop[0].uuid] > 0.0
         assert probs[sorted_pop[1].uuid] > 0.0
         assert probs[sorted_pop[2].uuid] == 0.0
@@ -651,11 +611,11 @@ class TestTopNClippingBehavior:
         # n=4, pressure=1.0; raw weights=[4,3,2,1]; top 2 weights=[4,3]; sum=7
         # after TopN(2): 4/7 and 3/7
         population = make_population(1.0, 2.0, 3.0, 4.0)
-        sorted_pop = sorted(population, key=lambda g: g.fitness)
+        sorted_pop = sorted(population, key=attrgetter("fitness"))
         wrapper = TopN(n=2, strategy=RankSelection(selection_pressure=1.0))
         ancestry = wrapper.select_ancestry(population[0], population)
 
-        probs = {uuid: prob for prob, uuid in ancestry}
+        probs = _probs(ancestry)
         assert abs(probs[sorted_pop[0].uuid] - 4 / 7) < 1e-9
         assert abs(probs[sorted_pop[1].uuid] - 3 / 7) < 1e-9
 
@@ -668,7 +628,7 @@ class TestTopNClippingBehavior:
         wrapper = TopN(n=1, strategy=EliteBreeds(thrive_count=2, die_count=1))
         ancestry = wrapper.select_ancestry(die_genome, population)
 
-        probs = {uuid: prob for prob, uuid in ancestry}
+        probs = _probs(ancestry)
         assert probs[thrive_first.uuid] == pytest.approx(1.0)
         assert probs[population[1].uuid] == pytest.approx(0.0)
 
@@ -682,14 +642,13 @@ class TestTopNClippingBehavior:
 
     def test_n_one_gives_winner_takes_all(self):
         population = make_population(1.0, 2.0, 3.0)
-        sorted_pop = sorted(population, key=lambda g: g.fitness)
+        sorted_pop = sorted(population, key=attrgetter("fitness"))
         wrapper = TopN(n=1, strategy=RankSelection(selection_pressure=1.0))
         ancestry = wrapper.select_ancestry(population[0], population)
 
-        probs = {uuid: prob for prob, uuid in ancestry}
+        probs = _probs(ancestry)
         assert probs[sorted_pop[0].uuid] == pytest.approx(1.0)
-        assert probs[sorted_pop[1].uuid] == pytest.approx(0.0)
-        assert probs[sorted_pop[2].uuid] == pytest.approx(0.0)
+        _assert_others_zero(probs, population, sorted_pop[0])
 
     def test_delegates_to_wrapped_strategy(self):
         # EliteBreeds: die genome gets equal probability from thrive tier
@@ -700,5 +659,5 @@ class TestTopNClippingBehavior:
         wrapper = TopN(n=1, strategy=EliteBreeds(thrive_count=1, die_count=1))
         ancestry = wrapper.select_ancestry(die_genome, population)
 
-        probs = {uuid: prob for prob, uuid in ancestry}
+        probs = _probs(ancestry)
         assert probs[thrive_genome.uuid] == pytest.approx(1.0)